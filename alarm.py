@@ -1,5 +1,4 @@
 import uuid
-from dataclasses import dataclass, field
 from typing import Set, Optional
 
 # RepeatSetting Enum 제거
@@ -11,33 +10,161 @@ from typing import Set, Optional
 # 요일 이름 (월요일 시작)
 WEEKDAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
 
-@dataclass
+def days_to_mask(days: Set[int]) -> int:
+    """요일 집합(월=0 ~ 일=6)을 7비트 마스크로 변환합니다."""
+    mask = 0
+    for day in days:
+        if 0 <= day < 7:
+            mask |= 1 << day
+    return mask
+
+def mask_to_days(mask: int) -> Set[int]:
+    """7비트 요일 마스크를 요일 집합으로 변환합니다."""
+    return {day for day in range(7) if mask & (1 << day)}
+
+def time_str_to_minutes(time_str: str) -> int:
+    """"HH:MM" 문자열을 자정 기준 분(0~1439)으로 변환합니다. 형식이 잘못되면 ValueError."""
+    hour_str, minute_str = time_str.split(':')
+    hour, minute = int(hour_str), int(minute_str)
+    if not (0 <= hour < 24 and 0 <= minute < 60):
+        raise ValueError(f"잘못된 시간 형식: {time_str}")
+    return hour * 60 + minute
+
+def minutes_to_time_str(minute_of_day: int) -> str:
+    """자정 기준 분을 "HH:MM" 문자열로 변환합니다."""
+    return f"{minute_of_day // 60:02d}:{minute_of_day % 60:02d}"
+
+# 요일 마스크(0~127) -> get_repeat_str 결과. 마스크 종류가 128개뿐이므로 미리 계산해 모든 알람이 공유
+_REPEAT_STRS = []
+for _mask in range(128):
+    _names = [WEEKDAYS[day] for day in range(7) if _mask & (1 << day)]
+    _REPEAT_STRS.append("" if not _names else "[Daily]" if len(_names) == 7 else f"[{', '.join(_names)}]")
+del _mask, _names
+
 class Alarm:
-    title: str
-    time_str: str # HH:MM 형식
-    # repeat 필드 대신 selected_days 필드 추가 (월=0 ~ 일=6)
-    selected_days: Set[int] = field(default_factory=set)
-    enabled: bool = True
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
-    sound_path: Optional[str] = None # 알람별 사운드 경로 추가
+    """알람 하나. 시각은 자정 기준 분(minute_of_day), 반복 요일은 7비트 마스크(days_mask)로 저장합니다.
+
+    __slots__를 사용하고 set 대신 정수 마스크를 저장하므로 알람 수가 많을 때 메모리 사용량이 작습니다.
+    이전 dataclass와 같은 생성자와 time_str/selected_days 속성을 그대로 제공합니다.
+    selected_days는 매번 새 set을 반환하므로 요일을 바꿀 때는 set을 수정하지 말고 다시 대입해야 합니다.
+    """
+    __slots__ = ('id', '_title', '_minute', '_mask', '_enabled', '_sound_path', '_display_str')
+
+    def __init__(self, title: str, time_str: str, selected_days: Optional[Set[int]] = None, enabled: bool = True,
+                 id: Optional[str] = None, sound_path: Optional[str] = None):
+        self.id = id if id is not None else str(uuid.uuid4())
+        self._title = title
+        self._minute = time_str_to_minutes(time_str)
+        self._mask = days_to_mask(selected_days) if selected_days else 0
+        self._enabled = enabled
+        self._sound_path = sound_path # 알람별 사운드 경로
+        self._display_str: Optional[str] = None # __str__ 캐시 (표시에 쓰이는 값이 바뀌면 None)
+
+    @classmethod
+    def from_parts(cls, id: str, title: str, minute_of_day: int, days_mask: int, enabled: bool = True,
+                   sound_path: Optional[str] = None) -> "Alarm":
+        """이미 분/마스크로 저장된 값(바이너리 스냅샷, SQLite 행)에서 문자열 파싱 없이 만듭니다."""
+        alarm = cls.__new__(cls)
+        alarm.id = id
+        alarm._title = title
+        alarm._minute = minute_of_day
+        alarm._mask = days_mask
+        alarm._enabled = enabled
+        alarm._sound_path = sound_path
+        alarm._display_str = None
+        return alarm
+
+    @property
+    def title(self) -> str:
+        return self._title
+
+    @title.setter
+    def title(self, value: str):
+        self._title = value
+        self._display_str = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool):
+        self._enabled = value
+        self._display_str = None
+
+    @property
+    def sound_path(self) -> Optional[str]:
+        return self._sound_path
+
+    @sound_path.setter
+    def sound_path(self, value: Optional[str]):
+        self._sound_path = value
+        self._display_str = None
+
+    @property
+    def minute_of_day(self) -> int:
+        """자정 기준 분 (0~1439)."""
+        return self._minute
+
+    @minute_of_day.setter
+    def minute_of_day(self, value: int):
+        if not 0 <= value < 24 * 60:
+            raise ValueError(f"잘못된 시각(분): {value}")
+        self._minute = value
+        self._display_str = None
+
+    @property
+    def days_mask(self) -> int:
+        """반복 요일 7비트 마스크 (월=비트 0 ~ 일=비트 6). 0이면 일회성 알람."""
+        return self._mask
+
+    @days_mask.setter
+    def days_mask(self, value: int):
+        self._mask = value & 0x7F
+        self._display_str = None
+
+    @property
+    def time_str(self) -> str:
+        """HH:MM 형식의 시각."""
+        return minutes_to_time_str(self._minute)
+
+    @time_str.setter
+    def time_str(self, value: str):
+        self.minute_of_day = time_str_to_minutes(value)
+
+    @property
+    def selected_days(self) -> Set[int]:
+        """선택된 요일 집합 (월=0 ~ 일=6). 비어 있으면 일회성 알람."""
+        return mask_to_days(self._mask)
+
+    @selected_days.setter
+    def selected_days(self, value: Set[int]):
+        self.days_mask = days_to_mask(value)
 
     def get_repeat_str(self) -> str:
         """선택된 요일을 문자열로 반환합니다."""
-        if not self.selected_days:
-            return ""
-        if len(self.selected_days) == 7:
-            return "[Daily]"
-        # 선택된 요일 번호를 요일 이름 약자로 변환하여 정렬
-        sorted_days = sorted(list(self.selected_days))
-        day_names = [WEEKDAYS[day] for day in sorted_days]
-        return f"[{', '.join(day_names)}]"
+        return _REPEAT_STRS[self._mask]
 
     def __str__(self):
-        # UI 목록 표시에 사용될 문자열 형식
-        repeat_str = self.get_repeat_str()
-        status_str = "🔔" if self.enabled else "🔕"
-        # --- 사운드 지정 여부 표시 추가 --- 
-        sound_indicator = " 🔊" if self.sound_path else ""
-        # ---------------------------------
-        # repeat_str이 비어있지 않으면 공백 추가
-        return f"{status_str} {self.time_str} - {self.title}{sound_indicator}{' ' + repeat_str if repeat_str else ''}" 
\ No newline at end of file
+        # UI 목록 표시에 사용될 문자열 형식 (값이 바뀌기 전까지 캐시)
+        if self._display_str is None:
+            repeat_str = self.get_repeat_str()
+            status_str = "🔔" if self._enabled else "🔕"
+            sound_indicator = " 🔊" if self._sound_path else "" # 사운드 지정 여부 표시
+            # repeat_str이 비어있지 않으면 공백 추가
+            self._display_str = f"{status_str} {self.time_str} - {self._title}{sound_indicator}{' ' + repeat_str if repeat_str else ''}"
+        return self._display_str
+
+    def _fields(self) -> tuple:
+        return (self._title, self._minute, self._mask, self._enabled, self.id, self._sound_path)
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    __hash__ = None # 변경 가능한 객체 (이전 dataclass와 동일)
+
+    def __repr__(self):
+        return (f"Alarm(title={self._title!r}, time_str={self.time_str!r}, selected_days={self.selected_days!r}, "
+                f"enabled={self._enabled!r}, id={self.id!r}, sound_path={self._sound_path!r})")
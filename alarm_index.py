@@ -0,0 +1,136 @@
+import bisect
+import datetime
+import heapq
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from alarm import Alarm
+from alarm_store import AlarmStore
+
+MINUTES_PER_DAY = 24 * 60
+# 요일 마스크가 0인 일회성 알람은 어느 요일에나 해당하므로 별도 버킷에 모음
+ONCE_BUCKET = 7
+
+class _Bucket:
+    """자정 기준 분으로 정렬된 (분, 알람 ID) 배열. 분은 array('H')에 따로 두어 bisect로 범위를 찾습니다."""
+    __slots__ = ('minutes', 'ids')
+
+    def __init__(self):
+        self.minutes = array('H')
+        self.ids: List[str] = []
+
+    def fill(self, entries: List[Tuple[int, str]]):
+        """(분, ID) 목록으로 한 번에 채웁니다. (초기 구성 시 항목마다 insert하는 O(n^2) 대신 정렬 한 번)"""
+        entries.sort(key=lambda entry: entry[0])
+        self.minutes = array('H', [minute for minute, _ in entries])
+        self.ids = [alarm_id for _, alarm_id in entries]
+
+    def insert(self, minute: int, alarm_id: str):
+        index = bisect.bisect_right(self.minutes, minute)
+        self.minutes.insert(index, minute)
+        self.ids.insert(index, alarm_id)
+
+    def remove(self, minute: int, alarm_id: str):
+        # 같은 분의 항목 중에서 ID가 일치하는 것을 찾음 (같은 분의 알람 수만큼만 확인)
+        index = bisect.bisect_left(self.minutes, minute)
+        while self.ids[index] != alarm_id:
+            index += 1
+        del self.minutes[index]
+        del self.ids[index]
+
+    def between(self, start_minute: int, end_minute: int) -> Iterator[Tuple[int, str]]:
+        lo = bisect.bisect_left(self.minutes, start_minute)
+        hi = bisect.bisect_left(self.minutes, end_minute, lo)
+        return zip(self.minutes[lo:hi], self.ids[lo:hi])
+
+class AlarmTimeIndex:
+    """요일별로 정렬된 시각 색인. "화요일 09:00~10:00에 울리는 활성 알람" 같은 범위 질의를 bisect로 처리합니다.
+
+    생성 시 AlarmStore의 알람으로 색인을 만들고, 이후에는 store의 추가/변경/삭제 이벤트로 해당 알람만 갱신합니다.
+    질의 비용은 O(log n + 결과 수)이며 time_str을 다시 파싱하지 않습니다.
+    """
+
+    def __init__(self, store: AlarmStore):
+        self.store = store
+        self._buckets = [_Bucket() for _ in range(ONCE_BUCKET + 1)]
+        self._entries: Dict[str, Tuple[int, int]] = {} # 알람 ID -> 색인된 (분, 요일 마스크)
+        initial: List[List[Tuple[int, str]]] = [[] for _ in self._buckets]
+        for alarm in store:
+            entry = (alarm.minute_of_day, alarm.days_mask)
+            self._entries[alarm.id] = entry
+            for number in self._bucket_numbers(entry[1]):
+                initial[number].append((entry[0], alarm.id))
+        for bucket, entries in zip(self._buckets, initial):
+            bucket.fill(entries)
+        store.add_listener(on_added=self._add, on_changed=self._update, on_removed=self._remove)
+
+    def _bucket_numbers(self, mask: int) -> List[int]:
+        if not mask:
+            return [ONCE_BUCKET]
+        return [day for day in range(7) if mask & (1 << day)]
+
+    def _add(self, alarm: Alarm):
+        entry = (alarm.minute_of_day, alarm.days_mask)
+        self._entries[alarm.id] = entry
+        for number in self._bucket_numbers(entry[1]):
+            self._buckets[number].insert(entry[0], alarm.id)
+
+    def _remove(self, alarm: Alarm):
+        entry = self._entries.pop(alarm.id, None)
+        if entry is not None:
+            for number in self._bucket_numbers(entry[1]):
+                self._buckets[number].remove(entry[0], alarm.id)
+
+    def _update(self, alarm: Alarm):
+        # 시각/요일이 그대로면(제목, 활성 상태만 바뀐 경우) 색인은 손대지 않음
+        if self._entries.get(alarm.id) != (alarm.minute_of_day, alarm.days_mask):
+            self._remove(alarm)
+            self._add(alarm)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def alarms_between(self, start_minute: int, end_minute: int, weekday: Optional[int] = None,
+                       enabled: Optional[bool] = None) -> List[Alarm]:
+        """자정 기준 분 [start_minute, end_minute) 범위의 알람을 시각순으로 반환합니다.
+
+        weekday(월=0 ~ 일=6)를 주면 그 요일에 울리는 반복 알람과 일회성 알람만 포함합니다.
+        (sqlite_storage.alarms_between과 같은 의미)
+        """
+        if weekday is None:
+            numbers = range(ONCE_BUCKET + 1)
+        else:
+            numbers = (weekday, ONCE_BUCKET)
+        merged = heapq.merge(*(self._buckets[number].between(start_minute, end_minute) for number in numbers))
+        result = []
+        seen = set() # 여러 요일에 반복되는 알람은 한 번만
+        for _, alarm_id in merged:
+            if alarm_id in seen:
+                continue
+            seen.add(alarm_id)
+            alarm = self.store.get(alarm_id)
+            if alarm is not None and (enabled is None or alarm.enabled == enabled):
+                result.append(alarm)
+        return result
+
+    def occurrences_between(self, start: datetime.datetime, end: datetime.datetime,
+                            enabled: Optional[bool] = True) -> List[Tuple[datetime.datetime, Alarm]]:
+        """[start, end) 구간에 울리는 (시각, 알람) 목록을 시간순으로 반환합니다. (예: 앞으로 3시간)
+
+        일회성 알람은 구간 안의 첫 해당 시각에 한 번만 포함됩니다. 기본값은 활성 알람만.
+        """
+        result = []
+        once_seen = set()
+        day = start.replace(hour=0, minute=0, second=0, microsecond=0)
+        while day < end:
+            # 이 날짜에서 [start, end)에 걸치는 분 범위 (초 단위는 다음 분으로 올림)
+            start_minute = max(0, -(-(start - day).total_seconds() // 60))
+            end_minute = min(MINUTES_PER_DAY, -(-(end - day).total_seconds() // 60))
+            for alarm in self.alarms_between(int(start_minute), int(end_minute), day.weekday(), enabled):
+                if not alarm.days_mask:
+                    if alarm.id in once_seen:
+                        continue
+                    once_seen.add(alarm.id)
+                result.append((day + datetime.timedelta(minutes=alarm.minute_of_day), alarm))
+            day += datetime.timedelta(days=1)
+        return result
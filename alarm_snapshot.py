@@ -0,0 +1,141 @@
+"""알람 목록의 바이너리 스냅샷 캐시.
+
+alarms.json(과 저널)을 읽어 만든 최종 알람 목록을 고정 폭 레코드로 저장해 두고, 다음 시작 때는
+JSON을 파싱하지 않고 mmap으로 열어 접근하는 알람만 Alarm 객체로 만듭니다.
+JSON이 원본(교환 형식)이고 이 파일은 캐시일 뿐이므로, 원본 파일의 mtime/크기가 기록된 값과 다르면 버립니다.
+
+파일 구성 (리틀 엔디언):
+    헤더     _HEADER: 매직, 버전, 레코드 수, 저널 레코드 수, 스냅샷 mtime_ns/크기, 저널 mtime_ns/크기
+    레코드   _RECORD x 레코드 수: 분(uint16), 요일 마스크(uint8), 플래그(uint8),
+             문자열 테이블 안의 (오프셋, 길이) uint32 쌍 x 3 (id, title, sound_path)
+    문자열   UTF-8 바이트
+"""
+import os
+import mmap
+import struct
+import logging
+from collections.abc import Sequence
+from typing import Any, Dict, List, Optional, Tuple
+
+from alarm import Alarm, days_to_mask, mask_to_days, minutes_to_time_str, time_str_to_minutes
+
+MAGIC = b"APAKSNAP"
+VERSION = 1
+
+_HEADER = struct.Struct("<8sIIIqqqq")
+_RECORD = struct.Struct("<HBB6I")
+
+FLAG_ENABLED = 0x01
+FLAG_HAS_SOUND = 0x02 # sound_path가 None과 빈 문자열을 구분하기 위함
+
+# 원본 파일 상태: (스냅샷 mtime_ns, 크기, 저널 mtime_ns, 크기). 파일이 없으면 (0, -1)
+SourceKey = Tuple[int, int, int, int]
+
+def _file_key(path: str) -> Tuple[int, int]:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return 0, -1
+    return st.st_mtime_ns, st.st_size
+
+def source_key(snapshot_path: str, journal_path: str) -> SourceKey:
+    """캐시 유효성 확인에 쓰는 원본 파일들의 현재 상태를 반환합니다."""
+    return _file_key(snapshot_path) + _file_key(journal_path)
+
+def write_snapshot(path: str, records: List[Dict[str, Any]], key: SourceKey, journal_records: int = 0):
+    """저장 형식의 알람 레코드(storage._alarm_record) 목록을 바이너리 스냅샷으로 씁니다."""
+    strings = bytearray()
+    packed = bytearray()
+
+    def intern(value: str) -> Tuple[int, int]:
+        data = value.encode('utf-8')
+        offset = len(strings)
+        strings.extend(data)
+        return offset, len(data)
+
+    for record in records:
+        sound_path = record.get('sound_path')
+        flags = (FLAG_ENABLED if record.get('enabled', True) else 0) | (FLAG_HAS_SOUND if sound_path is not None else 0)
+        packed.extend(_RECORD.pack(time_str_to_minutes(record['time_str']), days_to_mask(record.get('selected_days', ())),
+                                   flags, *intern(record['id']), *intern(record['title']), *intern(sound_path or "")))
+    header = _HEADER.pack(MAGIC, VERSION, len(records), journal_records, *key)
+    temp_path = path + ".tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(header)
+        f.write(packed)
+        f.write(strings)
+    os.replace(temp_path, path)
+
+class AlarmSnapshot(Sequence):
+    """mmap으로 연 바이너리 스냅샷. 인덱스로 접근할 때 해당 레코드만 Alarm으로 만듭니다. (한 번 만든 객체는 재사용)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, count, journal_records, *key = _HEADER.unpack_from(self._map, 0)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"지원하지 않는 스냅샷 형식 (버전 {version})")
+            self._strings = _HEADER.size + count * _RECORD.size
+            if self._strings > len(self._map):
+                raise ValueError("스냅샷 파일이 잘렸습니다.")
+        except (struct.error, ValueError):
+            self._map.close()
+            raise
+        self._count = count
+        self.journal_records = journal_records
+        self.key: SourceKey = tuple(key)
+        self._alarms: List[Optional[Alarm]] = [None] * count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _string(self, offset: int, length: int) -> str:
+        start = self._strings + offset
+        return self._map[start:start + length].decode('utf-8')
+
+    def _unpack(self, index: int):
+        minute, mask, flags, id_off, id_len, title_off, title_len, sound_off, sound_len = \
+            _RECORD.unpack_from(self._map, _HEADER.size + index * _RECORD.size)
+        sound_path = self._string(sound_off, sound_len) if flags & FLAG_HAS_SOUND else None
+        return (self._string(id_off, id_len), self._string(title_off, title_len), minute, mask,
+                bool(flags & FLAG_ENABLED), sound_path)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("알람 스냅샷 인덱스 범위 초과")
+        alarm = self._alarms[index]
+        if alarm is None:
+            alarm = Alarm.from_parts(*self._unpack(index))
+            self._alarms[index] = alarm
+        return alarm
+
+    def record(self, index: int) -> Dict[str, Any]:
+        """index번째 알람의 저장 형식 레코드를 만듭니다. (Alarm 객체를 만들지 않음)"""
+        alarm_id, title, minute, mask, enabled, sound_path = self._unpack(index)
+        return {'id': alarm_id, 'title': title, 'time_str': minutes_to_time_str(minute), 'selected_days': sorted(mask_to_days(mask)),
+                'enabled': enabled, 'sound_path': sound_path}
+
+    def close(self):
+        # Windows에서는 매핑이 열려 있는 동안 파일을 교체할 수 없으므로 다시 쓰기 전에 닫아야 함
+        self._map.close()
+
+def open_snapshot(path: str, key: SourceKey) -> Optional[AlarmSnapshot]:
+    """캐시가 있고 원본 파일 상태(key)와 일치하면 열어서 반환합니다. 없거나 오래됐거나 손상됐으면 None."""
+    if not os.path.exists(path):
+        return None
+    try:
+        snapshot = AlarmSnapshot(path)
+    except (OSError, ValueError, struct.error) as e:
+        logging.warning(f"바이너리 스냅샷({path})을 열 수 없어 무시합니다: {e}")
+        return None
+    if snapshot.key != key:
+        logging.info("알람 파일이 바이너리 스냅샷 이후 변경되어 캐시를 무시합니다.")
+        snapshot.close()
+        return None
+    return snapshot
@@ -0,0 +1,111 @@
+import copy
+import logging
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from alarm import Alarm
+
+# update()로 바꿀 수 있는 알람 필드 (id는 색인 키이므로 제외)
+UPDATABLE_FIELDS = frozenset({'title', 'time_str', 'selected_days', 'minute_of_day', 'days_mask', 'enabled', 'sound_path'})
+
+AlarmListener = Callable[[Alarm], None]
+
+class AlarmStore:
+    """알람 목록의 단일 소유자.
+
+    알람을 ID 색인(추가 순서 유지)으로 보관하고, 추가/변경/삭제가 일어날 때마다 해당 알람 하나만 리스너에
+    알립니다. 저장소, 스케줄러, UI는 이 이벤트만 받아 처리하므로 목록 전체를 다시 보내거나 훑을 필요가 없습니다.
+    리스너는 변경을 호출한 스레드에서 동기적으로 호출됩니다.
+    """
+
+    def __init__(self, alarms: Iterable[Alarm] = ()):
+        self._alarms: Dict[str, Alarm] = {alarm.id: alarm for alarm in alarms}
+        self._added: List[AlarmListener] = []
+        self._changed: List[AlarmListener] = []
+        self._removed: List[AlarmListener] = []
+
+    def add_listener(self, on_added: Optional[AlarmListener] = None, on_changed: Optional[AlarmListener] = None,
+                     on_removed: Optional[AlarmListener] = None):
+        """이벤트 리스너를 등록합니다. 각 리스너는 대상 Alarm 하나를 인자로 받습니다."""
+        if on_added:
+            self._added.append(on_added)
+        if on_changed:
+            self._changed.append(on_changed)
+        if on_removed:
+            self._removed.append(on_removed)
+
+    def _emit(self, listeners: List[AlarmListener], alarm: Alarm):
+        for listener in listeners:
+            try:
+                listener(alarm)
+            except Exception:
+                logging.exception(f"알람 이벤트 처리 실패: {getattr(listener, '__qualname__', listener)} ({alarm.id})")
+
+    def __len__(self) -> int:
+        return len(self._alarms)
+
+    def __iter__(self) -> Iterator[Alarm]:
+        return iter(list(self._alarms.values()))
+
+    def __contains__(self, alarm_id: str) -> bool:
+        return alarm_id in self._alarms
+
+    def get(self, alarm_id: str) -> Optional[Alarm]:
+        """ID로 알람을 찾습니다. (O(1)) 없으면 None."""
+        return self._alarms.get(alarm_id)
+
+    def alarms(self) -> List[Alarm]:
+        """추가된 순서의 알람 목록 사본."""
+        return list(self._alarms.values())
+
+    def add(self, alarm: Alarm) -> Alarm:
+        """알람을 추가합니다. 같은 ID가 이미 있으면 ValueError."""
+        if alarm.id in self._alarms:
+            raise ValueError(f"이미 있는 알람 ID: {alarm.id}")
+        self._alarms[alarm.id] = alarm
+        logging.info(f"새 알람 추가됨: {alarm}")
+        self._emit(self._added, alarm)
+        return alarm
+
+    def update(self, alarm_id: str, **changes) -> Alarm:
+        """알람의 필드를 바꿉니다. (예: update(id, enabled=False)) 실제로 바뀐 값이 있을 때만 changed 이벤트를 보냅니다.
+
+        값 하나라도 잘못되면 ValueError 등을 올리고 아무 필드도 바꾸지 않습니다.
+        """
+        alarm = self._alarms.get(alarm_id)
+        if alarm is None:
+            raise KeyError(alarm_id)
+        unknown = set(changes) - UPDATABLE_FIELDS
+        if unknown:
+            raise AttributeError(f"바꿀 수 없는 알람 필드: {', '.join(sorted(unknown))}")
+        # 사본에 먼저 적용: 중간 값이 잘못되어 예외가 나도 저장된 알람은 바뀌지 않음
+        updated = copy.copy(alarm)
+        for name, value in changes.items():
+            setattr(updated, name, value)
+        if updated != alarm:
+            before = copy.copy(alarm)
+            for slot in Alarm.__slots__:
+                setattr(alarm, slot, getattr(updated, slot))
+            logging.info(f"알람 변경됨: ID {alarm_id}, 이전 값: {before}, 새 값: {alarm}")
+            self._emit(self._changed, alarm)
+        return alarm
+
+    def remove(self, alarm_id: str) -> Optional[Alarm]:
+        """알람을 삭제하고 삭제된 알람을 반환합니다. 없으면 None."""
+        alarm = self._alarms.pop(alarm_id, None)
+        if alarm is not None:
+            logging.info(f"알람 삭제됨: {alarm}")
+            self._emit(self._removed, alarm)
+        return alarm
+
+    def replace_all(self, alarms: Iterable[Alarm]):
+        """목록 전체를 바꿉니다. (파일 다시 읽기 등) 기존 목록과 비교해 달라진 알람만 이벤트를 보냅니다."""
+        incoming = {alarm.id: alarm for alarm in alarms}
+        for alarm_id in [alarm_id for alarm_id in self._alarms if alarm_id not in incoming]:
+            self.remove(alarm_id)
+        for alarm_id, alarm in incoming.items():
+            current = self._alarms.get(alarm_id)
+            if current is None:
+                self.add(alarm)
+            elif current != alarm:
+                self._alarms[alarm_id] = alarm
+                self._emit(self._changed, alarm)
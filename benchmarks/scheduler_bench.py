@@ -0,0 +1,129 @@
+"""스케줄러 벤치마크.
+
+schedule_alarms / update_scheduled_alarm / remove_scheduled_alarm 과 실행 루프의 틱당 비용을
+알람 개수별로 측정하고, 결과를 JSON으로 출력합니다. 디스플레이/오디오 장치 없이 실행됩니다.
+
+사용 예:
+    python benchmarks/scheduler_bench.py
+    python benchmarks/scheduler_bench.py --sizes 10 1000 --output bench.json
+"""
+import argparse
+import datetime
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+# 저장소 루트의 모듈(alarm, scheduler)을 임포트할 수 있도록 경로 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
+
+import scheduler
+from alarm import Alarm
+from scheduler import HeapScheduler, SimulatedClock
+
+DEFAULT_SIZES = [10, 1000, 10000, 100000]
+
+def make_alarms(count: int, seed: int = 0) -> List[Alarm]:
+    """임의의 시각/요일을 가진 알람 목록을 만듭니다. (약 10%는 일회성)"""
+    rng = random.Random(seed)
+    alarms = []
+    for i in range(count):
+        days = set() if rng.random() < 0.1 else {day for day in range(7) if rng.random() < 0.6} or {rng.randrange(7)}
+        alarms.append(Alarm(title=f"Alarm {i}", time_str=f"{rng.randrange(24):02d}:{rng.randrange(60):02d}", selected_days=days))
+    return alarms
+
+def measure(func: Callable[[], None]) -> Dict[str, float]:
+    """함수 실행의 벽시계 시간과 tracemalloc 최대 메모리를 측정합니다."""
+    tracemalloc.start()
+    started = time.perf_counter()
+    func()
+    wall_seconds = time.perf_counter() - started
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"wall_seconds": wall_seconds, "peak_memory_bytes": peak_bytes}
+
+def bench_size(count: int, ops: int, seed: int) -> Dict[str, dict]:
+    """알람 count개에 대한 각 연산의 측정 결과를 반환합니다."""
+    alarms = make_alarms(count, seed)
+    rng = random.Random(seed + 1)
+    results = {}
+
+    full = measure(lambda: scheduler.schedule_alarms(alarms))
+    full["per_alarm_seconds"] = full["wall_seconds"] / count
+    results["schedule_alarms"] = full
+
+    targets = rng.sample(alarms, min(ops, count))
+
+    def update_all():
+        for alarm in targets:
+            alarm.time_str = f"{rng.randrange(24):02d}:{rng.randrange(60):02d}"
+            scheduler.update_scheduled_alarm(alarm)
+    update = measure(update_all)
+    update["ops"] = len(targets)
+    update["per_op_seconds"] = update["wall_seconds"] / len(targets)
+    results["update_scheduled_alarm"] = update
+
+    def remove_all():
+        for alarm in targets:
+            scheduler.remove_scheduled_alarm(alarm.id)
+    remove = measure(remove_all)
+    remove["ops"] = len(targets)
+    remove["per_op_seconds"] = remove["wall_seconds"] / len(targets)
+    results["remove_scheduled_alarm"] = remove
+
+    # 실행 루프 틱당 비용: 가상 시계로 하루를 재생하며, 깨어난 횟수와 실행 횟수로 나눔
+    start = datetime.datetime(2024, 1, 1, 0, 0, 30)
+    clock = SimulatedClock(start, start + datetime.timedelta(days=1))
+    fires = []
+    engine = HeapScheduler(missed_handler=fires.extend, clock=clock)
+    for alarm in alarms:
+        engine.add_alarm(alarm, lambda alarm, scheduled_at=None: fires.append(alarm))
+    wakeups = [0]
+    original_run_pending = engine.run_pending
+
+    def counting_run_pending():
+        wakeups[0] += 1
+        original_run_pending()
+    engine.run_pending = counting_run_pending
+    tick = measure(lambda: engine.run_forever(threading.Event()))
+    tick["simulated_seconds"] = 24 * 60 * 60
+    tick["wakeups"] = wakeups[0]
+    tick["fires"] = len(fires)
+    tick["per_wakeup_seconds"] = tick["wall_seconds"] / max(wakeups[0], 1)
+    tick["per_fire_seconds"] = tick["wall_seconds"] / max(len(fires), 1)
+    results["run_continuously_tick"] = tick
+
+    scheduler.schedule_alarms([]) # 다음 크기 측정을 위해 전역 스케줄 정리
+    return results
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="알람 스케줄러 벤치마크 (JSON 출력)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="측정할 알람 개수 목록")
+    parser.add_argument("--ops", type=int, default=1000, help="update/remove 측정 시 연산 횟수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (생략 시 표준 출력)")
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.CRITICAL) # 알람별 로그가 측정값을 왜곡하지 않도록 비활성화
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "results": {str(size): bench_size(size, args.ops, args.seed) for size in args.sizes},
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+import math
+import threading
+import logging
+import json
+from typing import Dict, Optional
+
+# 히스토그램 범위와 해상도: 0.1ms ~ 10000초, 버킷 경계는 2^(1/8)배(약 9%) 간격
+_MIN_SECONDS = 1e-4
+_MAX_SECONDS = 1e4
+_BUCKETS_PER_OCTAVE = 8
+_BUCKET_COUNT = int(math.ceil(math.log2(_MAX_SECONDS / _MIN_SECONDS) * _BUCKETS_PER_OCTAVE)) + 1
+
+class LatencyHistogram:
+    """고정 크기 로그 스케일 히스토그램. 기록 비용 O(1), 메모리는 표본 수와 무관하게 일정합니다."""
+
+    def __init__(self):
+        self._counts = [0] * _BUCKET_COUNT
+        self._count = 0
+        self._total = 0.0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        """지연 시간(초)을 하나 기록합니다. 음수(시계 보정 등)는 0으로 취급합니다."""
+        seconds = max(0.0, seconds)
+        if seconds <= _MIN_SECONDS:
+            index = 0
+        else:
+            index = min(_BUCKET_COUNT - 1, int(math.log2(seconds / _MIN_SECONDS) * _BUCKETS_PER_OCTAVE) + 1)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._total += seconds
+            if seconds > self._max:
+                self._max = seconds
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """주어진 백분위(0~100)의 근사값(버킷 상한, 최대값 이하)을 반환합니다. 표본이 없으면 None."""
+        with self._lock:
+            if not self._count:
+                return None
+            target = max(1, math.ceil(self._count * percent / 100))
+            cumulative = 0
+            for index, count in enumerate(self._counts):
+                cumulative += count
+                if cumulative >= target:
+                    upper = _MIN_SECONDS * 2 ** (index / _BUCKETS_PER_OCTAVE)
+                    return min(upper, self._max)
+            return self._max
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        """count/mean/p50/p95/p99/max 요약을 반환합니다. (단위: 초)"""
+        with self._lock:
+            count, total, maximum = self._count, self._total, self._max
+        return {
+            "count": count,
+            "mean": total / count if count else None,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": maximum if count else None,
+        }
+
+    def reset(self):
+        with self._lock:
+            self._counts = [0] * _BUCKET_COUNT
+            self._count = 0
+            self._total = 0.0
+            self._max = 0.0
+
+class QueueDepthGauge:
+    """대기열 깊이(대기 + 실행 중 작업 수)의 현재값/최대값/평균을 기록합니다."""
+
+    def __init__(self):
+        self._current = 0
+        self._peak = 0
+        self._samples = 0
+        self._total = 0
+        self._lock = threading.Lock()
+
+    def record(self, depth: int):
+        with self._lock:
+            self._current = depth
+            self._samples += 1
+            self._total += depth
+            if depth > self._peak:
+                self._peak = depth
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        """current/peak/mean 요약을 반환합니다. (단위: 작업 수)"""
+        with self._lock:
+            return {
+                "current": self._current,
+                "peak": self._peak,
+                "mean": self._total / self._samples if self._samples else None,
+            }
+
+    def reset(self):
+        with self._lock:
+            self._current = 0
+            self._peak = 0
+            self._samples = 0
+            self._total = 0
+
+# 예정 시각 -> run_alarm 시작까지의 지연
+fire_start_latency = LatencyHistogram()
+# 예정 시각 -> 알림 창 표시 완료(create_and_show_dialog 종료)까지의 지연
+dialog_shown_latency = LatencyHistogram()
+# 알람 실행 작업자 풀의 대기열 깊이 (작업 제출/완료 시마다 기록)
+fire_queue_depth = QueueDepthGauge()
+
+def record_fire_start(scheduled_ts: float, started_ts: float):
+    """run_alarm이 시작된 시각을 예정 시각(에포크 초)과 비교해 기록합니다."""
+    if scheduled_ts:
+        fire_start_latency.record(started_ts - scheduled_ts)
+
+def record_dialog_shown(scheduled_ts: float, shown_ts: float):
+    """알림 창 표시가 끝난 시각을 예정 시각(에포크 초)과 비교해 기록합니다."""
+    if scheduled_ts:
+        dialog_shown_latency.record(shown_ts - scheduled_ts)
+
+def record_queue_depth(depth: int):
+    """알람 실행 작업자 풀의 현재 대기열 깊이를 기록합니다."""
+    fire_queue_depth.record(depth)
+
+def latency_stats() -> Dict[str, Dict[str, Optional[float]]]:
+    """실행 지연 통계(와 실행 대기열 깊이)를 사전으로 반환합니다."""
+    return {
+        "fire_start": fire_start_latency.summary(),
+        "dialog_shown": dialog_shown_latency.summary(),
+        "fire_queue_depth": fire_queue_depth.summary(),
+    }
+
+def dump_latency_stats() -> str:
+    """실행 지연 통계를 로그로 남기고 JSON 문자열로 반환합니다."""
+    text = json.dumps(latency_stats())
+    logging.info(f"알람 실행 지연 통계(초): {text}")
+    return text
@@ -0,0 +1,100 @@
+import threading
+import queue
+import logging
+import zlib
+import functools
+from typing import Any, Callable, List, Optional, Tuple
+
+import fire_metrics
+
+# 기본 작업자(레인) 수
+DEFAULT_FIRE_WORKERS = 4
+
+class FirePool:
+    """알람 실행 함수를 정해진 수의 작업자 스레드에서 실행하는 풀.
+
+    작업자마다 전용 대기열(레인)을 두고, 같은 키(알람 ID)의 작업은 항상 같은 레인에 넣습니다.
+    따라서 한 알람의 실행은 제출 순서대로 처리되고, 느린 알람 하나는 자기 레인만 지연시킵니다.
+    """
+
+    def __init__(self, workers: int = DEFAULT_FIRE_WORKERS):
+        if workers < 1:
+            raise ValueError("작업자 수는 1 이상이어야 합니다.")
+        self._lanes: List[queue.SimpleQueue] = [queue.SimpleQueue() for _ in range(workers)]
+        self._depth = 0 # 제출되었지만 아직 끝나지 않은 작업 수 (대기 + 실행 중)
+        self._lock = threading.Lock()
+        self._threads = [
+            threading.Thread(target=self._worker, args=(lane,), name=f"AlarmFire-{index}", daemon=True)
+            for index, lane in enumerate(self._lanes)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def lane_of(self, key: str) -> int:
+        """키가 배정되는 레인 번호를 반환합니다. (같은 레인의 작업은 제출 순서대로 하나씩 실행됨)"""
+        # hash()는 실행마다 달라지므로 고정된 해시로 레인 선택
+        return zlib.crc32(key.encode("utf-8")) % len(self._lanes)
+
+    def _lane_for(self, key: str) -> queue.SimpleQueue:
+        return self._lanes[self.lane_of(key)]
+
+    def _change_depth(self, delta: int):
+        with self._lock:
+            self._depth += delta
+            depth = self._depth
+        fire_metrics.record_queue_depth(depth)
+
+    def queue_depth(self) -> int:
+        """아직 끝나지 않은 작업 수를 반환합니다."""
+        with self._lock:
+            return self._depth
+
+    def submit_batch(self, tasks: List[Tuple[str, Callable[[], Any]]],
+                     on_done: Optional[Callable[[List[Tuple[bool, Any]]], None]] = None):
+        """(키, 함수) 작업 목록을 제출합니다.
+
+        모든 작업이 끝나면 제출 순서대로 (성공 여부, 반환값) 목록을 on_done에 전달합니다.
+        on_done은 마지막 작업을 끝낸 작업자 스레드에서 호출됩니다.
+        """
+        if not tasks:
+            return
+        results: List[Tuple[bool, Any]] = [(False, None)] * len(tasks)
+        remaining = [len(tasks)]
+        batch_lock = threading.Lock()
+
+        def finish(index: int, result: Tuple[bool, Any]):
+            results[index] = result
+            with batch_lock:
+                remaining[0] -= 1
+                last = remaining[0] == 0
+            if last and on_done is not None:
+                on_done(results)
+
+        self._change_depth(len(tasks))
+        for index, (key, func) in enumerate(tasks):
+            self._lane_for(key).put((func, functools.partial(finish, index)))
+
+    def _worker(self, lane: queue.SimpleQueue):
+        while True:
+            item = lane.get()
+            if item is None:
+                break
+            func, finish = item
+            try:
+                result = (True, func())
+            except Exception:
+                logging.exception("알람 실행 작업 중 오류 발생")
+                result = (False, None)
+            self._change_depth(-1)
+            try:
+                finish(result)
+            except Exception:
+                logging.exception("알람 실행 완료 처리 중 오류 발생")
+
+    def shutdown(self, wait: bool = True):
+        """남은 작업을 모두 처리한 뒤 작업자 스레드를 종료합니다."""
+        for lane in self._lanes:
+            lane.put(None)
+        if wait:
+            for thread in self._threads:
+                thread.join()
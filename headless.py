@@ -0,0 +1,160 @@
+"""PyQt 없이 알람만 실행하는 헤드리스 데몬.
+
+저장된 알람을 storage.load_alarms로 불러와 스케줄러를 실행하고, 알람이 울리면 지정한 출력(sink)으로 전달합니다.
+Qt 모듈을 전혀 임포트하지 않으므로 GUI 빌드보다 메모리 사용량과 시작 시간이 훨씬 작습니다.
+
+실행 예:
+    python headless.py                                   # 표준 출력
+    python headless.py --log-file fires.log              # 로그 파일에 추가
+    python headless.py --exec 'notify-send "$ALARM_TITLE"' # 알람마다 명령 실행
+    python headless.py --upcoming 3                      # 앞으로 3시간 안에 울릴 알람을 출력하고 종료
+SIGHUP을 받으면 알람 파일을 다시 읽어 변경분만 반영합니다. (POSIX)
+"""
+import os
+import sys
+import signal
+import logging
+import argparse
+import datetime
+import threading
+import subprocess
+from typing import List, Optional
+
+from alarm import Alarm
+from alarm_store import AlarmStore
+from alarm_index import AlarmTimeIndex
+from storage import load_alarms, ALARMS_FILE
+import scheduler
+
+# 명령 실행 출력의 최대 실행 시간(초). 넘기면 종료하고 다음 알람으로 진행
+COMMAND_TIMEOUT_SECONDS = 30
+
+def _format_fire(alarm: Alarm, scheduled_at: Optional[datetime.datetime], missed: bool) -> str:
+    moment = (scheduled_at or datetime.datetime.now()).strftime("%Y-%m-%d %H:%M:%S")
+    status = "MISSED" if missed else "FIRE"
+    return f"{moment}\t{status}\t{alarm.time_str}\t{alarm.title}\t{alarm.id}"
+
+class StdoutSink:
+    """알람마다 한 줄(탭 구분: 시각, 상태, HH:MM, 제목, ID)을 표준 출력에 씁니다."""
+
+    def deliver(self, alarms: List[Alarm], scheduled_at: Optional[datetime.datetime], missed: bool):
+        sys.stdout.write("".join(_format_fire(alarm, scheduled_at, missed) + "\n" for alarm in alarms))
+        sys.stdout.flush()
+
+class LogFileSink:
+    """StdoutSink와 같은 형식의 줄을 파일 끝에 추가합니다."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def deliver(self, alarms: List[Alarm], scheduled_at: Optional[datetime.datetime], missed: bool):
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("".join(_format_fire(alarm, scheduled_at, missed) + "\n" for alarm in alarms))
+
+class CommandSink:
+    """알람마다 셸 명령을 실행합니다. 알람 정보는 ALARM_* 환경 변수로 전달됩니다."""
+
+    def __init__(self, command: str):
+        self.command = command
+
+    def deliver(self, alarms: List[Alarm], scheduled_at: Optional[datetime.datetime], missed: bool):
+        for alarm in alarms:
+            env = dict(os.environ,
+                       ALARM_ID=alarm.id,
+                       ALARM_TITLE=alarm.title,
+                       ALARM_TIME=alarm.time_str,
+                       ALARM_SOUND=alarm.sound_path or "",
+                       ALARM_SCHEDULED=scheduled_at.isoformat() if scheduled_at else "",
+                       ALARM_MISSED="1" if missed else "0")
+            try:
+                subprocess.run(self.command, shell=True, env=env, timeout=COMMAND_TIMEOUT_SECONDS)
+            except subprocess.TimeoutExpired:
+                logging.error(f"알람 명령 실행 시간 초과({COMMAND_TIMEOUT_SECONDS}초): {alarm.title}")
+            except OSError as e:
+                logging.error(f"알람 명령 실행 실패: {e}")
+
+class SinkDispatcher:
+    """스케줄러의 fire_handler/missed_handler로 등록되어 모든 출력에 같은 알람 묶음을 전달합니다."""
+
+    def __init__(self, sinks: list):
+        self.sinks = sinks
+
+    def _deliver(self, alarms: List[Alarm], scheduled_at: Optional[datetime.datetime], missed: bool):
+        for sink in self.sinks:
+            try:
+                sink.deliver(alarms, scheduled_at, missed)
+            except Exception:
+                logging.exception(f"알람 출력 실패: {type(sink).__name__}")
+
+    def on_fire(self, alarms: List[Alarm], scheduled_at: Optional[datetime.datetime] = None):
+        self._deliver(alarms, scheduled_at, False)
+
+    def on_missed(self, alarms: List[Alarm]):
+        self._deliver(alarms, None, True)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="PyQt 없이 알람을 실행하는 헤드리스 데몬")
+    parser.add_argument("--stdout", action="store_true", help="표준 출력으로 전달 (다른 출력이 없으면 기본값)")
+    parser.add_argument("--log-file", help="실행 기록을 추가할 파일 경로")
+    parser.add_argument("--exec", dest="command", help="알람마다 실행할 셸 명령 (ALARM_* 환경 변수 제공)")
+    parser.add_argument("--backend", choices=[scheduler.BACKEND_THREAD, scheduler.BACKEND_TIMERFD],
+                        default=scheduler.BACKEND_TIMERFD, help="스케줄러 백엔드 (timerfd를 쓸 수 없으면 thread로 대체)")
+    parser.add_argument("--upcoming", type=float, metavar="HOURS",
+                        help="앞으로 HOURS시간 안에 울릴 활성 알람을 표준 출력 형식으로 출력하고 종료")
+    parser.add_argument("--verbose", action="store_true", help="상세 로그를 표준 오류에 출력")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format='%(asctime)s [%(levelname)s] %(message)s', stream=sys.stderr)
+
+    if args.upcoming is not None:
+        now = datetime.datetime.now()
+        index = AlarmTimeIndex(AlarmStore(load_alarms()))
+        for moment, alarm in index.occurrences_between(now, now + datetime.timedelta(hours=args.upcoming)):
+            sys.stdout.write(_format_fire(alarm, moment, False) + "\n")
+        return 0
+
+    sinks = []
+    if args.log_file:
+        sinks.append(LogFileSink(args.log_file))
+    if args.command:
+        sinks.append(CommandSink(args.command))
+    if args.stdout or not sinks:
+        sinks.append(StdoutSink())
+    dispatcher = SinkDispatcher(sinks)
+    scheduler.set_delivery_handlers(dispatcher.on_fire, dispatcher.on_missed)
+
+    store = AlarmStore(load_alarms())
+    logging.warning(f"헤드리스 모드: {ALARMS_FILE}에서 알람 {len(store)}개 로드.")
+    scheduler.start_scheduler(store.alarms(), backend=args.backend)
+    scheduler.watch_store(store)
+
+    wakeup = threading.Event()
+    requests = {"stop": False, "reload": False}
+
+    def request(name: str):
+        def handler(sig, frame):
+            requests[name] = True
+            wakeup.set()
+        return handler
+
+    signal.signal(signal.SIGINT, request("stop"))
+    signal.signal(signal.SIGTERM, request("stop"))
+    posix = hasattr(signal, "SIGHUP")
+    if posix:
+        signal.signal(signal.SIGHUP, request("reload"))
+
+    while not requests["stop"]:
+        # POSIX는 신호가 대기를 깨우므로 타임아웃 없이 대기. Windows는 Ctrl+C 확인을 위해 주기적으로 깨어남
+        wakeup.wait(None if posix else 1.0)
+        wakeup.clear()
+        if requests["reload"] and not requests["stop"]:
+            requests["reload"] = False
+            logging.warning("SIGHUP 수신: 알람 파일을 다시 읽습니다.")
+            store.replace_all(load_alarms()) # 달라진 알람만 이벤트로 스케줄에 반영
+
+    scheduler.stop_scheduler()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
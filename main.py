@@ -1,18 +1,24 @@
 import logging
+import datetime
 import sys
 import os
 import threading
 import time
 import signal
-from typing import List, Optional
+from typing import Optional
+
+# 자식 스케줄러 프로세스 모드 (패키지 빌드에서 같은 실행 파일을 자식으로 다시 실행한 경우): PyQt 임포트 전에 분기
+if "--scheduler-child" in sys.argv:
+    from scheduler_process import child_main
+    sys.exit(child_main(sys.argv[1:]))
+
 # PyQt5 임포트 추가/수정
 from PyQt5.QtWidgets import QApplication, QMessageBox, QSystemTrayIcon, QMenu, QAction
-from PyQt5.QtCore import Qt, QSettings # QSettings 임포트 추가
+from PyQt5.QtCore import Qt, QSettings, QTimer, QObject, pyqtSignal # QSettings 임포트 추가
 from PyQt5.QtGui import QIcon # QIcon 임포트 추가
 # ctypes 임포트 추가 (Windows API 호출용)
 import ctypes
 import platform
-import schedule # schedule 모듈 임포트 추가
 # Windows 레지스트리 접근용 winreg 임포트
 if platform.system() == "Windows":
     try:
@@ -82,13 +88,16 @@ def remove_from_startup(app_name: str):
 # log_setup 모듈에서 setup_logging 함수 임포트
 # from log_setup import setup_logging
 
-from alarm import Alarm
-from storage import load_alarms, save_alarms # APP_DATA_DIR, _ensure_dir_exists 임포트 제거
+from alarm_store import AlarmStore
+from storage import load_alarms # APP_DATA_DIR, _ensure_dir_exists 임포트 제거
+from save_worker import SaveWorker, DEFAULT_DEBOUNCE_SECONDS, DEFAULT_MAX_DELAY_SECONDS
 # from ui import AlarmApp # PyQt5 버전으로 변경
 from ui import AlarmApp
-from scheduler import start_scheduler, stop_scheduler, update_scheduled_alarm, remove_scheduled_alarm, _scheduler_thread # scheduler_thread 임포트 추가
+from scheduler import (start_scheduler, stop_scheduler, watch_store, next_occurrences, set_delivery_handlers,
+                       notify_alarms, notify_missed_alarms, BACKEND_QT, SCHEDULER_BACKENDS)
 # from notification import notification_helper, cleanup_sounds # notification_helper 제거
 from notification import cleanup_sounds 
+from fire_metrics import dump_latency_stats
 
 # --- 로깅 설정 수정 ---
 # 패키지된 상태인지 확인 (PyInstaller는 sys.frozen 속성을 설정함)
@@ -202,8 +211,17 @@ logging.info("High DPI Scaling 활성화됨.")
 
 # 저장된 알람 로드
 logging.debug("Loading alarms...") 
-alarms = load_alarms()
-logging.info(f"{len(alarms)}개의 알람 로드 완료.")
+# 알람 목록은 AlarmStore가 소유하고, UI/저장/스케줄러는 알람별 추가/변경/삭제 이벤트로 동기화됨
+alarm_store = AlarmStore(load_alarms())
+logging.info(f"{len(alarm_store)}개의 알람 로드 완료.")
+
+# 알람 저장은 백그라운드 작업자가 모아서 처리 (GUI 스레드는 디스크 I/O를 기다리지 않음)
+# 병합 대기 시간/최대 저장 지연은 QSettings의 saveDebounceMs / saveMaxDelayMs로 조정 가능
+save_worker = SaveWorker(
+    debounce_seconds=settings.value("saveDebounceMs", int(DEFAULT_DEBOUNCE_SECONDS * 1000), type=int) / 1000,
+    max_delay_seconds=settings.value("saveMaxDelayMs", int(DEFAULT_MAX_DELAY_SECONDS * 1000), type=int) / 1000,
+)
+save_worker.watch(alarm_store) # 바뀐 알람 하나씩 저장 예약
 
 logging.debug("Initializing QApplication...") 
 app = QApplication(sys.argv)
@@ -244,7 +262,7 @@ logging.debug(f"Loaded 'startOnBoot' setting: {initial_start_on_boot}")
 
 # UI 인스턴스 생성 (tray_icon 및 시작 프로그램 초기 상태 전달)
 logging.debug("Creating AlarmApp UI instance...")
-ui_app = AlarmApp(alarms, tray_icon, initial_start_on_boot)
+ui_app = AlarmApp(alarm_store, tray_icon, initial_start_on_boot)
 
 # --- 트레이 아이콘 관련 함수 정의 --- 
 def toggle_window_visibility(window):
@@ -259,9 +277,58 @@ def toggle_window_visibility(window):
 
 def handle_tray_activation(reason, window):
     """트레이 아이콘 클릭 처리 (왼쪽 클릭 시 창 토글)"""
+    refresh_next_alarm_display() # 메뉴/창을 열기 전에 다음 알람 정보 갱신
     if reason == QSystemTrayIcon.Trigger: # 왼쪽 버튼 클릭
         logging.debug("Tray icon activated (Trigger).")
         toggle_window_visibility(window)
+
+# 표시된 알람이 울린 뒤 다음 알람으로 넘어가도록 예정 시각 직후(밀리초)에 갱신
+NEXT_ALARM_REFRESH_DELAY_MS = 1000
+
+# 표시한 알람의 예정 시각과 다음 자정 중 이른 때에 한 번만 갱신 (주기적으로 깨어나지 않음)
+next_alarm_refresh_timer = QTimer(app)
+next_alarm_refresh_timer.setSingleShot(True)
+
+class NextAlarmRefresher(QObject):
+    """다른 스레드(스케줄러/작업자/자식 프로세스 읽기 스레드)의 알람 전달 후 GUI 스레드에서 표시를 갱신하기 위한 시그널."""
+    refresh_requested = pyqtSignal()
+
+next_alarm_refresher = NextAlarmRefresher()
+
+def refresh_next_alarm_display():
+    """스케줄러의 다음 실행 표를 읽어 트레이 툴팁과 목록 위 안내 문구를 갱신합니다.
+
+    표시한 알람이 울린 직후나 다음 자정 중 이른 때에 다시 호출되도록 타이머를 맞춥니다.
+    (알람 변경과 알람 전달 시에는 이벤트로 바로 갱신됨)
+    """
+    upcoming = next_occurrences(1)
+    if upcoming:
+        moment, alarm = upcoming[0]
+        next_text = f"Next: {moment.strftime('%a %H:%M')} - {alarm.title}"
+        tray_icon.setToolTip(f"AlarmReminderPAAKApp\n{next_text}")
+        midnight = datetime.datetime.combine(datetime.date.today() + datetime.timedelta(days=1), datetime.time())
+        refresh_at = min(moment.timestamp(), midnight.timestamp())
+        remaining_ms = int((refresh_at - time.time()) * 1000) + NEXT_ALARM_REFRESH_DELAY_MS
+        next_alarm_refresh_timer.start(max(0, remaining_ms)) # 길어야 다음 자정까지
+    else:
+        next_text = ""
+        tray_icon.setToolTip("AlarmReminderPAAKApp")
+        next_alarm_refresh_timer.stop() # 다음 알람 추가 시 store 이벤트로 다시 갱신
+    ui_app.set_next_alarm_text(next_text)
+
+next_alarm_refresh_timer.timeout.connect(refresh_next_alarm_display)
+# 다른 스레드에서 emit하면 큐 연결로 GUI 스레드에서 실행됨
+next_alarm_refresher.refresh_requested.connect(refresh_next_alarm_display)
+
+def deliver_alarms(alarms, scheduled_at=None):
+    """기본 알림 표시 후 다음 알람 표시를 갱신합니다. (스케줄러 fire_handler)"""
+    notify_alarms(alarms, scheduled_at)
+    next_alarm_refresher.refresh_requested.emit()
+
+def deliver_missed_alarms(alarms):
+    """놓친 알람 알림 표시 후 다음 알람 표시를 갱신합니다. (스케줄러 missed_handler)"""
+    notify_missed_alarms(alarms)
+    next_alarm_refresher.refresh_requested.emit()
 # --------------------------
 
 # --- 트레이 아이콘 액션 연결 완료 및 표시 --- 
@@ -273,45 +340,22 @@ tray_icon.show() # 트레이 아이콘 표시
 logging.debug("System tray icon setup complete and shown.")
 # ----------------------------------------
 
-# 스케줄러 시작 
-start_scheduler(alarms)
-
-# --- 시그널-슬롯 연결 (수정) --- 
-def handle_alarms_updated(updated_alarms: List[Alarm]):
-    """UI에서 알람 목록 변경 시 호출될 슬롯"""
-    logging.info(f"UI로부터 알람 업데이트 시그널 수신. 총 {len(updated_alarms)}개.")
-    save_alarms(updated_alarms)
-    
-    # 스케줄 업데이트 로직 (기존과 유사, 콜백 없이)
-    current_scheduled_ids = set()
-    try:
-        current_scheduled_ids = {next(iter(job.tags)) for job in schedule.get_jobs() if job.tags}
-    except Exception as e:
-        logging.error(f"스케줄된 작업 ID 가져오기 실패: {e}")
-        
-    updated_alarm_map = {a.id: a for a in updated_alarms}
-    
-    ids_to_update_or_add = []
-    ids_to_remove_from_schedule = list(current_scheduled_ids - set(updated_alarm_map.keys()))
-    
-    for alarm in updated_alarms:
-        ids_to_update_or_add.append(alarm.id)
-
-    for alarm_id in ids_to_remove_from_schedule:
-         logging.info(f"파일 목록에 없는 알람 ID {alarm_id} 스케줄 제거 요청.")
-         remove_scheduled_alarm(alarm_id)
-
-    for alarm_id in ids_to_update_or_add:
-        if alarm_id in updated_alarm_map:
-            logging.info(f"알람 ID {alarm_id} 스케줄 업데이트 요청.")
-            update_scheduled_alarm(updated_alarm_map[alarm_id]) # 콜백 없이 호출
-        else:
-            logging.warning(f"업데이트 대상 알람 ID {alarm_id}를 찾을 수 없습니다.")
-
-def handle_alarm_deleted(deleted_alarm_id: str):
-    """UI에서 알람 삭제 시 호출될 슬롯"""
-    logging.info(f"UI로부터 알람 삭제 시그널 수신: ID {deleted_alarm_id}")
-    remove_scheduled_alarm(deleted_alarm_id)
+# 스케줄러 시작. 기본은 메인 스레드의 QTimer (알람 실행/알림 표시가 모두 GUI 스레드에서 처리됨)
+# ALARM_SCHEDULER_BACKEND=process 로 실행하면 GUI와 분리된 자식 프로세스에서 스케줄링
+scheduler_backend = os.environ.get("ALARM_SCHEDULER_BACKEND", BACKEND_QT)
+if scheduler_backend not in SCHEDULER_BACKENDS:
+    logging.warning(f"알 수 없는 스케줄러 백엔드 '{scheduler_backend}', 기본값({BACKEND_QT})을 사용합니다.")
+    scheduler_backend = BACKEND_QT
+set_delivery_handlers(deliver_alarms, deliver_missed_alarms)
+start_scheduler(alarm_store.alarms(), backend=scheduler_backend)
+watch_store(alarm_store) # 바뀐 알람 하나씩 스케줄에 반영
+refresh_next_alarm_display()
+
+# --- 알람 변경 이벤트 연결 --- 
+# 스케줄러 리스너 다음에 등록되므로 다음 알람 표시는 스케줄이 갱신된 뒤에 계산됨
+alarm_store.add_listener(on_added=lambda alarm: refresh_next_alarm_display(),
+                         on_changed=lambda alarm: refresh_next_alarm_display(),
+                         on_removed=lambda alarm: refresh_next_alarm_display())
 
 def handle_start_on_boot_change(enabled: bool):
     """UI에서 시작 프로그램 설정 변경 시 호출될 슬롯"""
@@ -343,8 +387,6 @@ def handle_start_on_boot_change(enabled: bool):
          # QMessageBox.warning(None, "Error", "Failed to access Windows registry for startup settings.")
 
 
-ui_app.alarms_updated.connect(handle_alarms_updated)
-ui_app.alarm_deleted.connect(handle_alarm_deleted)
 ui_app.start_on_boot_changed.connect(handle_start_on_boot_change) # 시그널 연결 추가
 # -------------------------
 
@@ -360,12 +402,15 @@ else:
 
 # --- 앱 종료 시 정리 작업 연결 --- 
 app.aboutToQuit.connect(stop_scheduler)
+app.aboutToQuit.connect(save_worker.stop) # 대기 중인 저장을 모두 쓰고 종료
 app.aboutToQuit.connect(cleanup_sounds) 
+app.aboutToQuit.connect(dump_latency_stats) # 종료 시 알람 실행 지연 통계 기록
 
 # --- 시그널 핸들러 설정 (Ctrl+C 종료용) --- 
 def signal_handler(sig, frame):
     logging.info("Ctrl+C 감지됨. 애플리케이션 종료 중...")
     stop_scheduler()
+    save_worker.flush() # 대기 중인 저장을 즉시 기록
     cleanup_sounds() # 시그널 핸들러에서도 사운드 정리
     QApplication.quit()
 signal.signal(signal.SIGINT, signal_handler)
@@ -380,6 +425,7 @@ try:
 except Exception as e:
     logging.error("QApplication 이벤트 루프 중 예외 발생:", exc_info=True)
     stop_scheduler() # 예외 발생 시에도 스케줄러 중지 시도
+    save_worker.stop() # 예외 발생 시에도 대기 중인 저장 기록
     cleanup_sounds() # 예외 발생 시에도 사운드 정리 시도
     sys.exit(1) # 오류 코드 반환하며 종료
 
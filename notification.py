@@ -2,6 +2,9 @@ import logging
 import platform
 import os
 import sys
+import time
+
+import fire_metrics
 
 # PyQt5 QApplication 임포트 (위치 조정을 위해)
 from PyQt5.QtWidgets import QApplication # QMessageBox 제거
@@ -52,8 +55,8 @@ class NotificationHelper(QObject):
         else:
             logging.debug(f"NotificationHelper: 앱 아이콘 로드 성공 - {icon_path}")
 
-    @pyqtSlot(str, str, str) # 슬롯 정의 유지
-    def create_and_show_dialog(self, title, message, sound_path):
+    @pyqtSlot(str, str, str, float) # 슬롯 정의 유지 (마지막 인자: 예정 시각, 지연 측정용)
+    def create_and_show_dialog(self, title, message, sound_path, scheduled_ts=0.0):
         """메인 GUI 스레드에서 실행될 슬롯: CustomNotificationDialog 생성, 표시 및 사운드 재생"""
         global _active_dialogs, active_sounds
         try:
@@ -117,6 +120,9 @@ class NotificationHelper(QObject):
 
         except Exception as e:
             logging.error(f"메인 스레드에서 알림 생성/표시 실패: {e}", exc_info=True)
+        finally:
+            # 예정 시각 -> 알림 창 표시 완료까지의 지연 기록
+            fire_metrics.record_dialog_shown(scheduled_ts, time.time())
 
     def play_sound(self, sound_path):
         """(QMediaPlayer 사용) 지정된 경로의 사운드 파일을 재생하고 플레이어 객체를 반환합니다."""
@@ -276,8 +282,11 @@ class NotificationHelper(QObject):
 # 헬퍼 클래스 인스턴스 (처음 필요할 때 생성)
 _notification_helper_instance = None
 
-def show_notification(title: str, message: str, sound_path: str = None):
-    """커스텀 알림 창을 스레드 안전하게 표시하고, 지정된 경우 사운드를 재생합니다."""
+def show_notification(title: str, message: str, sound_path: str = None, scheduled_ts: float = 0.0):
+    """커스텀 알림 창을 스레드 안전하게 표시하고, 지정된 경우 사운드를 재생합니다.
+
+    scheduled_ts: 알람 예정 시각(에포크 초). 0이 아니면 알림 창 표시 지연을 기록합니다.
+    """
     global _notification_helper_instance
     
     app_instance = QApplication.instance()
@@ -306,7 +315,8 @@ def show_notification(title: str, message: str, sound_path: str = None):
             Qt.QueuedConnection,           # 이벤트 큐를 통해 비동기적으로 호출
             Q_ARG(str, title),             # 전달할 인자 1 (타입 명시)
             Q_ARG(str, message),           # 전달할 인자 2 (타입 명시)
-            Q_ARG(str, sound_path or "")  # 전달할 인자 3 (사운드 경로, 없으면 빈 문자열)
+            Q_ARG(str, sound_path or ""),  # 전달할 인자 3 (사운드 경로, 없으면 빈 문자열)
+            Q_ARG(float, scheduled_ts)     # 전달할 인자 4 (예정 시각, 지연 측정용)
         )
 
     except Exception as e:
@@ -0,0 +1,133 @@
+import logging
+import math
+import sys
+
+from PyQt5.QtCore import (QAbstractNativeEventFilter, QCoreApplication, QObject, QTimer, QThread, QMetaObject, Qt,
+                          pyqtSlot)
+
+# QTimer 간격 상한 (int 밀리초). 더 긴 대기는 중간에 깨어나 다시 계산합니다.
+MAX_TIMER_INTERVAL_MS = 2 ** 31 - 1
+
+# Windows 절전 복귀/시계 변경 메시지
+WM_TIMECHANGE = 0x001E
+WM_POWERBROADCAST = 0x0218
+PBT_APMRESUMESUSPEND = 0x0007
+PBT_APMRESUMEAUTOMATIC = 0x0012
+
+class _WindowsResumeFilter(QAbstractNativeEventFilter):
+    """최상위 창에 방송되는 절전 복귀(WM_POWERBROADCAST)와 시계 변경(WM_TIMECHANGE) 메시지를 감지합니다."""
+
+    def __init__(self, callback):
+        super().__init__()
+        self._callback = callback
+
+    def nativeEventFilter(self, event_type, message):
+        if event_type == b"windows_generic_MSG":
+            from ctypes import wintypes
+            msg = wintypes.MSG.from_address(int(message))
+            if msg.message == WM_TIMECHANGE or (
+                    msg.message == WM_POWERBROADCAST and msg.wParam in (PBT_APMRESUMESUSPEND, PBT_APMRESUMEAUTOMATIC)):
+                self._callback()
+        return False, 0
+
+class QtTimerBackend(QObject):
+    """다음 마감 시각에 맞춘 단일 single-shot QTimer로 HeapScheduler를 구동하는 백엔드.
+
+    스케줄러 스레드가 없으므로 알람 실행 함수와 알림 표시가 모두 메인(GUI) 스레드에서 실행되고,
+    UI가 Alarm 객체를 수정하는 동안 다른 스레드가 같은 객체를 읽는 일이 없습니다.
+    알람 추가/변경/제거 시 엔진의 on_change 콜백으로 타이머를 다시 맞춥니다.
+
+    QTimer는 절전 중에 멈추므로, OS의 절전 복귀/시계 변경 알림(Windows 메시지, Linux logind의
+    PrepareForSleep 신호)을 받으면 곧바로 만기 작업을 처리하고 타이머를 다시 맞춥니다. 알람 사이에 주기적으로
+    깨어나지 않습니다. (알림이 없는 환경에서는 SystemClock.max_wait로 주기 확인을 켤 수 있음)
+    """
+
+    def __init__(self, engine):
+        super().__init__()
+        self.engine = engine
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.PreciseTimer) # 기본(CoarseTimer)의 5% 오차 방지
+        self._timer.timeout.connect(self._on_timeout)
+        self._native_filter = None
+        self._dbus_connected = False
+
+    def start(self):
+        """만기된 작업을 처리하고 다음 마감 시각에 타이머를 맞춥니다."""
+        self.engine.on_change = self._request_rearm
+        self.engine.mark_clock()
+        self._watch_resume()
+        self._on_timeout()
+
+    def stop(self):
+        self.engine.on_change = None
+        self._timer.stop()
+        self._unwatch_resume()
+
+    def _watch_resume(self):
+        """OS의 절전 복귀/시계 변경 알림을 구독합니다. 사용할 수 없으면 경고만 남깁니다."""
+        if sys.platform == "win32":
+            self._native_filter = _WindowsResumeFilter(self._on_resume)
+            QCoreApplication.instance().installNativeEventFilter(self._native_filter)
+            return
+        try:
+            from PyQt5.QtDBus import QDBusConnection
+        except ImportError:
+            logging.warning("QtDBus를 사용할 수 없어 절전 복귀를 다음 타이머 만료 때 감지합니다.")
+            return
+        self._dbus_connected = QDBusConnection.systemBus().connect(
+            "org.freedesktop.login1", "/org/freedesktop/login1", "org.freedesktop.login1.Manager",
+            "PrepareForSleep", self._on_prepare_for_sleep)
+        if not self._dbus_connected:
+            logging.warning("logind 절전 신호를 구독할 수 없어 절전 복귀를 다음 타이머 만료 때 감지합니다.")
+
+    def _unwatch_resume(self):
+        if self._native_filter is not None:
+            QCoreApplication.instance().removeNativeEventFilter(self._native_filter)
+            self._native_filter = None
+        if self._dbus_connected:
+            from PyQt5.QtDBus import QDBusConnection
+            QDBusConnection.systemBus().disconnect(
+                "org.freedesktop.login1", "/org/freedesktop/login1", "org.freedesktop.login1.Manager",
+                "PrepareForSleep", self._on_prepare_for_sleep)
+            self._dbus_connected = False
+
+    @pyqtSlot(bool)
+    def _on_prepare_for_sleep(self, sleeping: bool):
+        if not sleeping: # False: 절전에서 복귀함
+            self._on_resume()
+
+    def _on_resume(self):
+        # 네이티브 이벤트 필터 안에서 알림 창을 띄우지 않도록 이벤트 루프로 넘겨서 처리
+        logging.info("절전 복귀/시계 변경 알림 수신: 스케줄을 다시 확인합니다.")
+        QTimer.singleShot(0, self._on_timeout)
+
+    def _request_rearm(self):
+        # QTimer는 소유 스레드에서만 조작할 수 있으므로, 다른 스레드의 변경은 이벤트 큐로 넘김
+        if QThread.currentThread() is self.thread():
+            self._rearm()
+        else:
+            QMetaObject.invokeMethod(self, "_rearm", Qt.QueuedConnection)
+
+    @pyqtSlot()
+    def _rearm(self):
+        engine = self.engine
+        timeout = engine.seconds_until_next(engine.clock.now())
+        if timeout is None:
+            self._timer.stop() # 작업이 없으면 다음 변경까지 대기하지 않음
+            return
+        # 시계에 max_wait가 설정된 경우에만 그 간격마다 깨어나 절전 복귀를 확인 (기본은 OS 복귀 알림에 맡김)
+        max_wait = getattr(engine.clock, 'max_wait', None)
+        if max_wait is not None:
+            timeout = min(timeout, max_wait)
+        self._timer.start(min(int(math.ceil(timeout * 1000)), MAX_TIMER_INTERVAL_MS))
+
+    def _on_timeout(self):
+        engine = self.engine
+        engine.check_clock_jump()
+        try:
+            engine.run_pending()
+        except Exception:
+            logging.exception("스케줄러 실행 중 오류 발생")
+        engine.mark_clock()
+        self._rearm()
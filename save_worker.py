@@ -0,0 +1,125 @@
+import copy
+import time
+import logging
+import threading
+from typing import Dict, Optional
+
+from alarm import Alarm
+from alarm_store import AlarmStore
+import storage
+
+# 마지막 변경 후 이 시간(초) 동안 추가 변경이 없으면 저장
+DEFAULT_DEBOUNCE_SECONDS = 0.5
+# 변경이 계속 들어와도 첫 변경 후 이 시간(초) 안에는 반드시 저장 (최대 저장 지연)
+DEFAULT_MAX_DELAY_SECONDS = 5.0
+
+def _snapshot(alarm: Alarm) -> Alarm:
+    # GUI 스레드가 같은 객체를 계속 수정하므로 제출 시점의 값을 복사해 둠 (필드가 모두 불변 값이므로 얕은 복사로 충분)
+    return copy.copy(alarm)
+
+class SaveWorker:
+    """알람 저장 요청을 모아 백그라운드 스레드에서 한 번에 쓰는 작업자.
+
+    짧은 시간 안에 연속으로 들어온 변경(빠른 토글, 연속 편집)은 debounce_seconds 동안 모아서
+    마지막 상태만 저장합니다. 호출한 스레드(GUI)는 디스크 I/O를 기다리지 않습니다.
+    """
+
+    def __init__(self, debounce_seconds: float = DEFAULT_DEBOUNCE_SECONDS,
+                 max_delay_seconds: float = DEFAULT_MAX_DELAY_SECONDS):
+        self.debounce_seconds = debounce_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self._condition = threading.Condition()
+        self._pending_ops: Dict[str, Optional[Alarm]] = {} # 알람 ID -> 저장할 알람 (None이면 삭제)
+        self._first_change = 0.0 # 아직 저장되지 않은 첫 변경 시각 (단조 시계)
+        self._last_change = 0.0
+        self._flush_requested = False
+        self._writing = False
+        self._stopped = False
+        self.write_count = 0 # 실제 저장 횟수 (요청 수 대비 병합 효과 확인용)
+        self._thread = threading.Thread(target=self._run, name="AlarmSaver", daemon=True)
+        self._thread.start()
+
+    def _mark_changed(self):
+        now = time.monotonic()
+        if not self._has_pending():
+            self._first_change = now
+        self._last_change = now
+        self._condition.notify_all()
+
+    def _has_pending(self) -> bool:
+        return bool(self._pending_ops)
+
+    def submit_alarm(self, alarm: Alarm):
+        """알람 하나의 추가/변경 저장을 예약합니다."""
+        snapshot = _snapshot(alarm)
+        with self._condition:
+            self._mark_changed()
+            self._pending_ops[alarm.id] = snapshot
+
+    def submit_delete(self, alarm_id: str):
+        """알람 하나의 삭제를 예약합니다."""
+        with self._condition:
+            self._mark_changed()
+            self._pending_ops[alarm_id] = None
+
+    def watch(self, store: AlarmStore):
+        """AlarmStore의 이벤트마다 해당 알람 하나의 저장/삭제를 예약합니다."""
+        store.add_listener(on_added=self.submit_alarm, on_changed=self.submit_alarm,
+                           on_removed=lambda alarm: self.submit_delete(alarm.id))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """예약된 저장을 즉시 실행하고 끝날 때까지 기다립니다. 시간 안에 끝나면 True."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            self._flush_requested = True
+            self._condition.notify_all()
+            while self._has_pending() or self._writing:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+            return True
+
+    def stop(self):
+        """남은 저장을 마치고 작업자 스레드를 종료합니다. (앱 종료 시)"""
+        self.flush()
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._stopped:
+                    if self._has_pending():
+                        if self._flush_requested:
+                            break
+                        now = time.monotonic()
+                        due = min(self._last_change + self.debounce_seconds, self._first_change + self.max_delay_seconds)
+                        if now >= due:
+                            break
+                        self._condition.wait(due - now)
+                    else:
+                        self._flush_requested = False
+                        self._condition.notify_all() # flush() 대기 해제
+                        self._condition.wait()
+                if self._stopped and not self._has_pending():
+                    return
+                pending_ops, self._pending_ops = self._pending_ops, {}
+                self._writing = True
+            try:
+                self._write(pending_ops)
+            except Exception:
+                logging.exception("백그라운드 알람 저장 중 오류 발생")
+            with self._condition:
+                self._writing = False
+                self.write_count += 1
+                self._condition.notify_all()
+
+    def _write(self, pending_ops: Dict[str, Optional[Alarm]]):
+        for alarm_id, alarm in pending_ops.items():
+            if alarm is None:
+                storage.delete_alarm(alarm_id)
+            else:
+                storage.save_alarm(alarm)
@@ -2,116 +2,725 @@ import schedule
 import time
 import threading
 import logging
-from typing import List, Callable, Optional
+from typing import List, Callable, Optional, Set, Dict, Tuple
 import datetime
+import heapq
+import bisect
+import functools
 
-# RepeatSetting 임포트 제거, WEEKDAYS 임포트
-from alarm import Alarm, WEEKDAYS #, RepeatSetting 
-from notification import show_notification
+from alarm import Alarm
+from alarm_store import AlarmStore
+import fire_metrics
+from fire_pool import FirePool, DEFAULT_FIRE_WORKERS
+import timerfd_scheduler
+# notification(PyQt5)은 실제 알림을 표시할 때만 지연 임포트 (시뮬레이션/헤드리스 실행 지원)
 
 # 스케줄러 실행 루프를 제어하기 위한 이벤트
 stop_run_continuously = threading.Event()
 
-def run_alarm(alarm: Alarm):
-    """알람이 울릴 때 실행될 함수. 알람 객체에서 직접 사운드 경로를 읽어 사용합니다."""
-    repeat_str = alarm.get_repeat_str() if alarm.selected_days else "One-time"
+MINUTES_PER_DAY = 24 * 60
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+
+# 예정 시각보다 이만큼(초) 이상 늦게 발견된 알람은 '놓친 알람'으로 모아서 전달
+MISSED_THRESHOLD_SECONDS = 60
+# 놓친 알람을 늦게라도 전달하는 기본 유예 시간(초). 이보다 오래된 알람은 건너뜀
+DEFAULT_CATCH_UP_GRACE_SECONDS = 6 * 60 * 60
+# 벽시계와 단조 시계의 경과 시간 차이가 이 값(초)을 넘으면 절전/시계 변경으로 판단
+CLOCK_JUMP_THRESHOLD_SECONDS = 5
+
+def minute_of_week(moment: datetime.datetime) -> int:
+    """datetime을 주 단위 분 슬롯 번호(요일*1440 + 분)로 변환합니다. (월요일 00:00 = 0)"""
+    return moment.weekday() * MINUTES_PER_DAY + moment.hour * 60 + moment.minute
+
+def next_slot_occurrence(slot: int, now: datetime.datetime) -> datetime.datetime:
+    """주어진 분 슬롯이 now 이후 처음으로 돌아오는 시각을 반환합니다."""
+    week_start = (now - datetime.timedelta(days=now.weekday())).replace(hour=0, minute=0, second=0, microsecond=0)
+    moment = week_start + datetime.timedelta(minutes=slot)
+    if moment <= now:
+        moment += datetime.timedelta(days=7)
+    return moment
+
+class SystemClock:
+    """실제 벽시계/단조 시계를 사용하고, 대기는 조건 변수에서 실제로 잠드는 기본 시계.
+
+    max_wait(초)를 주면 다음 마감이 멀어도 그 간격마다 깨어나 절전 복귀/시계 변경을 확인합니다. (선택 사항)
+    단조 시계 기반 대기는 절전 중 멈출 수 있어, 복귀 신호가 없는 스레드 백엔드에서만 필요합니다.
+    기본값 None은 다음 마감 시각까지 한 번도 깨어나지 않습니다.
+    """
+
+    def __init__(self, max_wait: Optional[float] = None):
+        self.max_wait = max_wait
+
+    def now(self) -> datetime.datetime:
+        return datetime.datetime.now()
+
+    def monotonic(self) -> float:
+        return time.monotonic()
+
+    def wait(self, condition: threading.Condition, timeout: Optional[float]) -> bool:
+        """다음 마감 시각(또는 notify)까지 대기합니다. 실행을 계속하면 True."""
+        condition.wait(timeout)
+        return True
+
+class SimulatedClock:
+    """가상 시계. 대기 요청 시 잠들지 않고 곧바로 다음 마감 시각으로 시간을 이동합니다.
+
+    end를 지나거나 더 이상 예정된 작업이 없으면 wait가 False를 반환해 실행 루프가 끝납니다.
+    """
+
+    # 가상 시간은 절전으로 멈추지 않으므로 대기 상한 없이 곧바로 마감 시각으로 이동
+    max_wait: Optional[float] = None
+
+    def __init__(self, start: datetime.datetime, end: Optional[datetime.datetime] = None):
+        self._now = start
+        self._monotonic = 0.0
+        self.end = end
+
+    def now(self) -> datetime.datetime:
+        return self._now
+
+    def monotonic(self) -> float:
+        return self._monotonic
+
+    def advance(self, seconds: float):
+        """가상 시간을 주어진 초만큼 앞으로 이동합니다. (벽시계와 단조 시계를 함께 이동)
+
+        대기 시간(seconds_until_next)과 같은 기준이 되도록 벽시계도 실제 경과 초(타임스탬프)로 이동합니다.
+        """
+        self._now = datetime.datetime.fromtimestamp(self._now.timestamp() + seconds)
+        self._monotonic += seconds
+
+    def wait(self, condition: threading.Condition, timeout: Optional[float]) -> bool:
+        if timeout is None:
+            return False
+        if self.end is not None and self._now.timestamp() + timeout > self.end.timestamp():
+            self.advance(max(0.0, self.end.timestamp() - self._now.timestamp()))
+            return False
+        self.advance(timeout)
+        return True
+
+class AlarmJob(schedule.Job):
+    """알람 하나의 모든 선택 요일을 7비트 마스크와 하나의 next_run으로 다루는 작업.
+
+    요일마다 schedule.Job을 따로 만들지 않으므로 알람당 작업 객체, 태그 집합, next_run 계산이 하나뿐입니다.
+    마스크가 0이면 일회성 알람으로, 다음 해당 시각에 한 번 실행됩니다.
+    """
+
+    def __init__(self, alarm: Alarm, clock: Optional[SystemClock] = None):
+        super().__init__(1)
+        self.clock = clock or SystemClock()
+        self.unit = "days"
+        self.minute_of_day = alarm.minute_of_day
+        self.at_time = datetime.time(self.minute_of_day // 60, self.minute_of_day % 60)
+        self.days_mask = alarm.days_mask
+        self.alarm = alarm
+
+    def do(self, job_func: Callable, *args, **kwargs):
+        """실행 함수를 지정하고 다음 실행 시각을 계산합니다.
+
+        작업 등록은 엔진의 ID 색인이 담당하므로 schedule의 전역 작업 목록에는 추가하지 않습니다.
+        """
+        self.job_func = functools.partial(job_func, *args, **kwargs)
+        functools.update_wrapper(self.job_func, job_func)
+        self._schedule_next_run()
+        return self
+
+    @property
+    def slots(self) -> List[int]:
+        """이 작업이 색인될 주 단위 분 슬롯 목록."""
+        if not self.days_mask:
+            return [minute_of_week(self.next_run)]
+        return [day * MINUTES_PER_DAY + self.minute_of_day for day in range(7) if self.days_mask & (1 << day)]
+
+    def run(self, scheduled_at: Optional[datetime.datetime] = None):
+        """실행 함수를 호출하고 다음 실행 시각을 계산합니다. (엔진 시계 기준)
+
+        scheduled_at: 이번 실행의 예정 시각. 실행 함수에 그대로 전달됩니다. (지연 측정용)
+        """
+        ret = self.job_func(scheduled_at=scheduled_at)
+        self.mark_run()
+        return ret
+
+    def mark_run(self):
+        """실행 기록을 남기고 다음 실행 시각으로 이동합니다."""
+        self.last_run = self.clock.now()
+        self._schedule_next_run()
+
+    def _schedule_next_run(self) -> None:
+        """선택된 요일 중 현재 이후 가장 가까운 실행 시각을 계산합니다."""
+        now = self.clock.now()
+        today_at = now.replace(hour=self.at_time.hour, minute=self.at_time.minute, second=0, microsecond=0)
+        mask = self.days_mask or 0x7F # 일회성 알람은 가장 가까운 해당 시각
+        for offset in range(8):
+            if mask & (1 << ((now.weekday() + offset) % 7)):
+                candidate = today_at + datetime.timedelta(days=offset)
+                if candidate > now:
+                    self.next_run = candidate
+                    return
+
+class _TickResults:
+    """작업자 풀의 여러 레인으로 나뉘어 실행된 한 틱의 결과를 모으는 카운트다운.
+
+    마지막 레인이 끝났을 때만 정상 실행된 알람 목록(틱의 원래 순서)을 돌려주므로 전달은 틱당 한 번입니다.
+    """
+
+    def __init__(self, due_jobs: List[tuple], lanes: int):
+        self.due_jobs = due_jobs
+        self._remaining = lanes
+        self._succeeded: Set[AlarmJob] = set()
+        self._lock = threading.Lock()
+
+    def finish_lane(self, lane_jobs: List[tuple], results: List[tuple]) -> Optional[List[Alarm]]:
+        with self._lock:
+            self._succeeded.update(job for (job, _), (ok, _) in zip(lane_jobs, results) if ok)
+            self._remaining -= 1
+            if self._remaining:
+                return None
+        return [job.alarm for job, _ in self.due_jobs if job in self._succeeded]
+
+class HeapScheduler:
+    """알람 작업을 주 단위 분 슬롯(요일*1440 + 분) 버킷에 색인하고, 사용 중인 슬롯만 최소 힙으로 관리하는 스케줄링 엔진.
+
+    매 초 모든 작업을 검사하는 대신, 가장 이른 슬롯의 시각까지 대기했다가 해당 슬롯 버킷의 작업만 실행합니다.
+    따라서 '지금 울릴 알람'을 찾는 비용은 전체 알람 수와 무관합니다.
+    작업 추가/제거 시 대기 중인 스레드를 깨워 마감 시각을 다시 계산합니다.
+    """
+
+    def __init__(self, fire_handler: Optional[Callable[[List[Alarm], Optional[datetime.datetime]], None]] = None,
+                 missed_handler: Optional[Callable[[List[Alarm]], None]] = None,
+                 catch_up_grace: float = DEFAULT_CATCH_UP_GRACE_SECONDS,
+                 clock: Optional[SystemClock] = None, executor: Optional[FirePool] = None):
+        self.clock = clock or SystemClock() # 현재 시각/대기 방식 (SimulatedClock으로 교체 가능)
+        self.executor = executor # 실행 함수를 돌릴 작업자 풀 (None이면 스케줄러 스레드에서 직접 실행)
+        self.fire_handler = fire_handler # 같은 틱에 울린 알람 목록과 가장 이른 예정 시각을 한 번에 전달받는 콜백
+        self.missed_handler = missed_handler # 놓친 알람 목록을 한 번에 전달받는 콜백
+        self.catch_up_grace = catch_up_grace
+        self._jobs_by_tag: Dict[str, List[AlarmJob]] = {} # 태그(알람 ID) -> 작업 목록
+        self._buckets: List[Optional[Set[schedule.Job]]] = [None] * MINUTES_PER_WEEK # 슬롯별 작업 집합
+        self._job_slots: Dict[AlarmJob, List[int]] = {} # 작업 -> 색인된 슬롯 목록
+        self._slot_deadlines: Dict[int, datetime.datetime] = {} # 사용 중인 슬롯 -> 다음 실행 시각
+        self._heap: List[tuple] = [] # (실행 시각, 슬롯) 최소 힙 (지연 삭제)
+        # 다음 실행 표: 사용 중인 슬롯을 주 단위 분 순서로 정렬해 둔 배열 (알람 변경 시 증분 갱신)
+        self._occupied_slots: List[int] = []
+        self._table_date: Optional[datetime.date] = None # 표 기준일 (날짜가 바뀌면 기준 주 재계산)
+        self._table_week_start: Optional[datetime.datetime] = None
+        self.lock = threading.RLock()
+        self._wakeup = threading.Condition(self.lock)
+        # 작업 변경 시 호출할 콜백 (스레드 없이 외부 타이머로 구동할 때 타이머를 다시 맞추기 위함)
+        self.on_change: Optional[Callable[[], None]] = None
+        # 시계 변경 감지 기준점 (마지막으로 확인한 벽시계/단조 시계 값)
+        self._last_wall: Optional[datetime.datetime] = None
+        self._last_mono = 0.0
+
+    def add_alarm(self, alarm: Alarm, job_func: Callable) -> AlarmJob:
+        """알람을 엔진 시계를 쓰는 AlarmJob으로 만들어 알람 ID 태그와 함께 등록합니다."""
+        # 선택된 모든 요일을 하나의 작업으로 등록 (요일 마스크)
+        job = AlarmJob(alarm, self.clock).do(job_func, alarm=alarm)
+        job.tag(alarm.id)
+        self.add_job(job)
+        return job
+
+    def add_job(self, job: AlarmJob):
+        """등록된 작업을 선택 요일의 슬롯 버킷에 추가하고 대기 중인 스레드를 깨웁니다."""
+        with self.lock:
+            now = self.clock.now()
+            slots = job.slots
+            for slot in slots:
+                bucket = self._buckets[slot]
+                if bucket is None:
+                    bucket = self._buckets[slot] = set()
+                    bisect.insort(self._occupied_slots, slot)
+                bucket.add(job)
+                if slot not in self._slot_deadlines:
+                    self._arm_slot(slot, next_slot_occurrence(slot, now))
+            self._job_slots[job] = slots
+            for tag in job.tags:
+                self._jobs_by_tag.setdefault(tag, []).append(job)
+            self._notify_changed()
+
+    def remove_tag(self, tag: str):
+        """태그가 붙은 작업을 ID 색인으로 찾아 버킷에서 제거합니다. 비게 된 슬롯의 힙 항목은 꺼낼 때 지연 삭제됩니다."""
+        with self.lock:
+            for job in list(self._jobs_by_tag.get(tag, ())):
+                self._discard_job(job)
+            self._compact_if_needed()
+            self._notify_changed()
+
+    def clear(self):
+        """모든 작업, 버킷, 힙을 비웁니다."""
+        with self.lock:
+            self._jobs_by_tag.clear()
+            self._buckets = [None] * MINUTES_PER_WEEK
+            self._job_slots.clear()
+            self._slot_deadlines.clear()
+            self._heap.clear()
+            self._occupied_slots.clear()
+            self._notify_changed()
+
+    def wake(self):
+        """대기 중인 스케줄러 스레드를 즉시 깨웁니다."""
+        with self.lock:
+            self._notify_changed()
+
+    def _notify_changed(self):
+        # 호출자가 lock을 잡고 있어야 함
+        self._wakeup.notify_all()
+        if self.on_change is not None:
+            self.on_change()
+
+    def get_jobs(self, tag: Optional[str] = None) -> List[AlarmJob]:
+        """태그가 붙은 작업 목록을 반환합니다. 태그를 생략하면 전체 작업 목록."""
+        with self.lock:
+            if tag is None:
+                return list(self._job_slots)
+            return list(self._jobs_by_tag.get(tag, ()))
+
+    def scheduled_tags(self) -> Set[str]:
+        """작업이 등록된 태그(알람 ID) 집합을 반환합니다."""
+        with self.lock:
+            return set(self._jobs_by_tag)
+
+    def has_tag(self, tag: str) -> bool:
+        with self.lock:
+            return tag in self._jobs_by_tag
+
+    def job_count(self) -> int:
+        with self.lock:
+            return len(self._job_slots)
+
+    def jobs_at(self, moment: datetime.datetime) -> List[AlarmJob]:
+        """주어진 시각의 분 슬롯에 색인된 작업 목록을 반환합니다."""
+        with self.lock:
+            return list(self._buckets[minute_of_week(moment)] or ())
+
+    def _week_start(self, now: datetime.datetime) -> datetime.datetime:
+        # 다음 실행 표의 기준(이번 주 월요일 00:00)은 날짜가 바뀔 때 한 번만 다시 계산
+        if self._table_date != now.date():
+            self._table_date = now.date()
+            self._table_week_start = (now - datetime.timedelta(days=now.weekday())).replace(hour=0, minute=0, second=0, microsecond=0)
+        return self._table_week_start
+
+    def next_occurrences(self, n: int, until: Optional[datetime.datetime] = None,
+                         now: Optional[datetime.datetime] = None) -> List[Tuple[datetime.datetime, Alarm]]:
+        """현재 이후 울릴 알람을 (시각, 알람) 목록으로 시간순으로 최대 n개 반환합니다.
+
+        정렬된 슬롯 표를 현재 분 위치에서부터 읽으므로 전체 작업의 next_run을 정렬하지 않습니다.
+        until을 주면 그 시각 이후의 항목은 제외합니다.
+        """
+        now = now or self.clock.now()
+        result = []
+        with self.lock:
+            slots = self._occupied_slots
+            if not slots or n <= 0:
+                return result
+            week_start = self._week_start(now)
+            start = bisect.bisect_right(slots, minute_of_week(now))
+            has_repeating = False
+            index = start
+            while len(result) < n:
+                cycle, position = divmod(index, len(slots))
+                first_cycle = index - start < len(slots)
+                if not first_cycle and not has_repeating:
+                    break # 일회성 알람만 남은 경우 한 바퀴로 충분
+                slot = slots[position]
+                moment = week_start + datetime.timedelta(weeks=cycle, minutes=slot)
+                if until is not None and moment > until:
+                    break
+                for job in sorted(self._buckets[slot], key=lambda j: j.alarm.title):
+                    if job.days_mask:
+                        has_repeating = True
+                    elif not first_cycle:
+                        continue # 일회성 알람은 첫 실행만 포함
+                    result.append((moment, job.alarm))
+                    if len(result) >= n:
+                        break
+                index += 1
+        return result
+
+    def _discard_job(self, job: AlarmJob):
+        for tag in job.tags:
+            tagged_jobs = self._jobs_by_tag.get(tag)
+            if tagged_jobs is not None and job in tagged_jobs:
+                tagged_jobs.remove(job)
+                if not tagged_jobs:
+                    del self._jobs_by_tag[tag]
+        for slot in self._job_slots.pop(job, ()):
+            bucket = self._buckets[slot]
+            bucket.discard(job)
+            if not bucket:
+                self._buckets[slot] = None
+                self._slot_deadlines.pop(slot, None)
+                del self._occupied_slots[bisect.bisect_left(self._occupied_slots, slot)]
+
+    def _arm_slot(self, slot: int, deadline: datetime.datetime):
+        self._slot_deadlines[slot] = deadline
+        heapq.heappush(self._heap, (deadline, slot))
+
+    def _is_live(self, entry: tuple) -> bool:
+        deadline, slot = entry
+        return self._slot_deadlines.get(slot) == deadline
+
+    def _compact_if_needed(self):
+        # 지연 삭제로 쌓인 오래된 항목이 유효 항목보다 훨씬 많아지면 힙을 재구성
+        if len(self._heap) > 2 * len(self._slot_deadlines) + 64:
+            self._heap = [(deadline, slot) for slot, deadline in self._slot_deadlines.items()]
+            heapq.heapify(self._heap)
+
+    def next_deadline(self) -> Optional[datetime.datetime]:
+        """가장 이른 슬롯의 실행 시각을 반환합니다. 작업이 없으면 None."""
+        with self.lock:
+            while self._heap:
+                if self._is_live(self._heap[0]):
+                    return self._heap[0][0]
+                heapq.heappop(self._heap)
+            return None
+
+    def seconds_until_next(self, now: datetime.datetime) -> Optional[float]:
+        """가장 이른 슬롯까지 남은 초를 반환합니다. 작업이 없으면 None.
+
+        naive 시각끼리 빼면 일광 절약 시간 전환(±1시간)이 반영되지 않으므로 POSIX 타임스탬프로 계산합니다.
+        """
+        deadline = self.next_deadline()
+        if deadline is None:
+            return None
+        return max(0.0, deadline.timestamp() - now.timestamp())
+
+    def _pop_due_jobs(self, now: datetime.datetime):
+        """만기된 슬롯을 꺼내 (제시간 작업, 유예 시간 내 놓친 작업, 유예 시간이 지난 작업)으로 나눕니다."""
+        due, missed, expired = [], {}, {}
+        while self._heap and self._heap[0][0] <= now:
+            entry = heapq.heappop(self._heap)
+            if not self._is_live(entry):
+                continue
+            deadline, slot = entry
+            lateness = now.timestamp() - deadline.timestamp() # 일광 절약 시간 전환을 반영한 실제 지연
+            # 슬롯 버킷이 곧 이번에 실행할 작업 목록 (작업별 should_run 검사 불필요)
+            if lateness <= MISSED_THRESHOLD_SECONDS:
+                due.extend((job, deadline) for job in self._buckets[slot])
+            elif lateness <= self.catch_up_grace:
+                missed.update(dict.fromkeys(self._buckets[slot]))
+            else:
+                expired.update(dict.fromkeys(self._buckets[slot]))
+            # 며칠간 절전했더라도 슬롯당 한 번만 다음 시각으로 재설정
+            self._arm_slot(slot, next_slot_occurrence(slot, now))
+        for job in missed:
+            expired.pop(job, None)
+        return due, list(missed), list(expired)
+
+    def _skip_missed_job(self, job: AlarmJob):
+        """놓친 작업을 실행하지 않고 다음 실행 시각으로 넘깁니다. 일회성 작업은 제거합니다."""
+        if not job.days_mask:
+            self._discard_job(job)
+        else:
+            job._schedule_next_run()
+
+    def run_pending(self):
+        """만기된 슬롯의 작업만 실행하고, 이번 틱에 울린 알람과 놓친 알람을 각각 한 번에 모아 전달합니다."""
+        with self.lock:
+            due_jobs, missed_jobs, expired_jobs = self._pop_due_jobs(self.clock.now())
+            for job in missed_jobs + expired_jobs:
+                self._skip_missed_job(job)
+        if expired_jobs:
+            logging.warning(f"유예 시간({self.catch_up_grace}초)이 지난 놓친 알람 {len(expired_jobs)}개를 건너뜁니다.")
+        if missed_jobs:
+            logging.warning(f"놓친 알람 {len(missed_jobs)}개를 한 번에 전달합니다.")
+            if self.missed_handler is not None:
+                try:
+                    self.missed_handler([job.alarm for job in missed_jobs])
+                except Exception:
+                    logging.exception("놓친 알람 전달 중 오류 발생")
+        if not due_jobs:
+            return
+        if self.executor is None:
+            results = []
+            for job, scheduled_at in due_jobs:
+                try:
+                    results.append((True, job.run(scheduled_at)))
+                except Exception:
+                    logging.exception(f"스케줄 작업 실행 중 오류 발생: {job}")
+                    job._schedule_next_run() # 같은 작업이 즉시 반복 실행되지 않도록 다음 시각으로 이동
+                    results.append((False, None))
+            self._finish_due_jobs(due_jobs, results)
+            return
+        # 다음 실행 시각 계산은 이 스레드에서 끝내고, 실행 함수만 알람 ID별 레인에 넘김
+        # (느린 실행 함수가 타이밍이나 다른 알람의 실행을 지연시키지 않음)
+        with self.lock:
+            for job, _ in due_jobs:
+                job.mark_run()
+        # 레인별로 제출해 레인이 끝나는 대로 결과(CancelJob 제거)를 반영하고,
+        # 마지막 레인이 끝나면 이번 틱의 알람을 한 번에 전달 (틱당 알림 창 1개)
+        lanes: Dict[int, List[tuple]] = {}
+        for job, scheduled_at in due_jobs:
+            lanes.setdefault(self.executor.lane_of(job.alarm.id), []).append((job, scheduled_at))
+        tick = _TickResults(due_jobs, len(lanes))
+        for lane_jobs in lanes.values():
+            tasks = [(job.alarm.id, functools.partial(job.job_func, scheduled_at=scheduled_at))
+                     for job, scheduled_at in lane_jobs]
+            self.executor.submit_batch(tasks, functools.partial(self._finish_lane, tick, lane_jobs))
+
+    def _finish_lane(self, tick: "_TickResults", lane_jobs: List[tuple], results: List[tuple]):
+        """한 레인의 결과를 반영하고, 틱의 마지막 레인이면 모인 알람을 한 번에 전달합니다. (작업자 스레드에서 호출)"""
+        self._apply_results(lane_jobs, results)
+        fired_alarms = tick.finish_lane(lane_jobs, results)
+        if fired_alarms is not None:
+            self._deliver_fired(fired_alarms, tick.due_jobs[0][1])
+
+    def _apply_results(self, due_jobs: List[tuple], results: List[tuple]) -> List[Alarm]:
+        """실행 결과를 반영(CancelJob이면 제거)하고 정상 실행된 알람 목록을 반환합니다."""
+        fired_alarms = []
+        with self.lock:
+            for (job, _), (ok, ret) in zip(due_jobs, results):
+                if not ok:
+                    continue
+                fired_alarms.append(job.alarm)
+                if job not in self._job_slots:
+                    continue # 실행 중에 제거된 작업
+                if isinstance(ret, schedule.CancelJob) or ret is schedule.CancelJob:
+                    self._discard_job(job)
+        return fired_alarms
+
+    def _finish_due_jobs(self, due_jobs: List[tuple], results: List[tuple]):
+        """실행 결과를 반영(CancelJob이면 제거)하고, 정상 실행된 알람을 fire_handler에 한 번에 전달합니다."""
+        self._deliver_fired(self._apply_results(due_jobs, results), due_jobs[0][1])
+
+    def _deliver_fired(self, fired_alarms: List[Alarm], scheduled_at: datetime.datetime):
+        if fired_alarms and self.fire_handler is not None:
+            # 같은 틱에 울린 알람은 한 번에 전달 (GUI 스레드 전환/알림 창/사운드 플레이어 각 1회)
+            try:
+                self.fire_handler(fired_alarms, scheduled_at)
+            except Exception:
+                logging.exception("알람 전달 중 오류 발생")
+
+    def handle_clock_jump(self, now: datetime.datetime, drift: float):
+        """벽시계가 단조 시계와 다르게 움직였을 때 호출됩니다.
+
+        앞으로 이동(절전 복귀, 시계 앞당김)한 경우 만기된 슬롯은 run_pending에서 놓친 알람으로 처리되고,
+        뒤로 이동한 경우 모든 슬롯의 다음 실행 시각을 현재 시각 기준으로 다시 계산합니다.
+        """
+        if drift > 0:
+            logging.warning(f"절전 복귀 또는 시계 변경 감지: 벽시계가 {drift:.1f}초 앞서 이동했습니다.")
+            return
+        logging.warning(f"시계 변경 감지: 벽시계가 {-drift:.1f}초 뒤로 이동했습니다. 스케줄을 다시 계산합니다.")
+        with self.lock:
+            for slot in self._slot_deadlines:
+                self._slot_deadlines[slot] = next_slot_occurrence(slot, now)
+            self._heap = [(deadline, slot) for slot, deadline in self._slot_deadlines.items()]
+            heapq.heapify(self._heap)
+            for job in self._job_slots:
+                job._schedule_next_run()
+
+    def mark_clock(self):
+        """현재 벽시계/단조 시계 값을 시계 변경 감지 기준점으로 기록합니다. (대기 직전에 호출)"""
+        self._last_wall, self._last_mono = self.clock.now(), self.clock.monotonic()
+
+    def check_clock_jump(self):
+        """기준점 이후 벽시계와 단조 시계의 경과 시간을 비교해 절전/시계 변경을 감지합니다. (깨어난 직후 호출)"""
+        wall, mono = self.clock.now(), self.clock.monotonic()
+        if self._last_wall is not None:
+            # 타임스탬프로 비교하므로 일광 절약 시간 전환은 시계 변경으로 보지 않음
+            drift = (wall.timestamp() - self._last_wall.timestamp()) - (mono - self._last_mono)
+            if abs(drift) > CLOCK_JUMP_THRESHOLD_SECONDS:
+                self.handle_clock_jump(wall, drift)
+        self._last_wall, self._last_mono = wall, mono
+
+    def run_forever(self, stop_event: threading.Event):
+        """stop_event가 설정될 때까지 가장 이른 마감 시각까지만 대기하며 작업을 실행합니다.
+
+        깨어날 때마다 벽시계와 단조 시계의 경과 시간을 비교해 절전/시계 변경을 감지합니다.
+        """
+        clock = self.clock
+        self.mark_clock()
+        while not stop_event.is_set():
+            self.check_clock_jump()
+            try:
+                self.run_pending()
+            except Exception:
+                logging.exception("스케줄러 실행 중 오류 발생")
+            with self.lock:
+                if stop_event.is_set():
+                    break
+                self.mark_clock()
+                timeout = self.seconds_until_next(self._last_wall)
+                if timeout is not None:
+                    timeout = min(timeout, threading.TIMEOUT_MAX)
+                # 시계에 max_wait가 설정된 경우에만 그 간격마다 깨어나 절전 복귀를 확인
+                max_wait = getattr(clock, 'max_wait', None)
+                if timeout is not None and max_wait is not None:
+                    timeout = min(timeout, max_wait)
+                # 작업이 없으면 타임아웃 없이 대기 (추가/제거/중지 시 notify로 깨어남)
+                # 가상 시계는 잠들지 않고 곧바로 마감 시각으로 이동
+                if not clock.wait(self._wakeup, timeout):
+                    break
+
+def run_alarm(alarm: Alarm, scheduled_at: Optional[datetime.datetime] = None):
+    """알람이 울릴 때 알람마다 실행될 함수. 알림 표시는 같은 틱의 알람을 모아 notify_alarms에서 한 번에 합니다.
+
+    scheduled_at: 예정 실행 시각. 예정 시각 대비 실행 지연을 fire_metrics에 기록합니다.
+    """
+    scheduled_ts = scheduled_at.timestamp() if scheduled_at else 0.0
+    fire_metrics.record_fire_start(scheduled_ts, time.time())
+    repeat_str = alarm.get_repeat_str() if alarm.days_mask else "One-time"
     logging.info(f"알람 실행: {alarm.title} ({alarm.time_str}) - 반복: {repeat_str}")
     
     # 알람 객체에서 사운드 경로 가져오기
     sound_path = alarm.sound_path 
     logging.debug(f"알람 [{alarm.title}]의 sound_path: {sound_path}") # 확인용 로그
 
-    show_notification(title=f"⏰ Alarm: {alarm.title}", message=f"It's {alarm.time_str}!", sound_path=sound_path)
-
     # 일회성 알람인 경우 (selected_days가 비어 있음), 실행 후 작업 취소
-    if not alarm.selected_days:
+    if not alarm.days_mask:
         logging.info(f"일회성 알람 '{alarm.title}' 실행 완료. 스케줄에서 제거합니다.")
         # 실제 알람 비활성화는 UI/메인 로직과 연동 필요 (선택적)
         # alarm.enabled = False # 예시: 여기서 직접 비활성화
         # save_alarms(...) # 변경사항 저장 필요
         return schedule.CancelJob # 작업을 스케줄러에서 제거
 
+# 묶음 알림 창에 표시할 최대 알람 줄 수
+MAX_SUMMARY_LINES = 20
+
+def _summary_message(alarms: List[Alarm]) -> str:
+    """여러 알람을 'HH:MM - 제목' 줄 목록으로 요약합니다."""
+    lines = [f"{alarm.time_str} - {alarm.title}" for alarm in alarms[:MAX_SUMMARY_LINES]]
+    if len(alarms) > MAX_SUMMARY_LINES:
+        lines.append(f"... and {len(alarms) - MAX_SUMMARY_LINES} more")
+    return "\n".join(lines)
+
+def _first_sound_path(alarms: List[Alarm]) -> Optional[str]:
+    """묶음 알림에서 재생할 사운드 (사운드가 지정된 첫 번째 알람)."""
+    return next((alarm.sound_path for alarm in alarms if alarm.sound_path), None)
+
+def notify_alarms(alarms: List[Alarm], scheduled_at: Optional[datetime.datetime] = None):
+    """같은 틱에 울린 알람들을 알림 창 하나와 사운드 플레이어 하나로 표시합니다."""
+    from notification import show_notification
+    scheduled_ts = scheduled_at.timestamp() if scheduled_at else 0.0
+    if len(alarms) == 1:
+        alarm = alarms[0]
+        show_notification(title=f"⏰ Alarm: {alarm.title}", message=f"It's {alarm.time_str}!",
+                          sound_path=alarm.sound_path, scheduled_ts=scheduled_ts)
+        return
+    logging.info(f"동시에 울린 알람 {len(alarms)}개 일괄 알림 표시.")
+    show_notification(title=f"⏰ Alarms ({len(alarms)})", message=_summary_message(alarms),
+                      sound_path=_first_sound_path(alarms), scheduled_ts=scheduled_ts)
+
+def notify_missed_alarms(alarms: List[Alarm]):
+    """절전/시계 변경으로 놓친 알람들을 하나의 알림으로 묶어 표시합니다."""
+    logging.info(f"놓친 알람 {len(alarms)}개 일괄 알림 표시.")
+    from notification import show_notification
+    show_notification(title=f"⏰ Missed Alarms ({len(alarms)})", message=_summary_message(alarms),
+                      sound_path=_first_sound_path(alarms))
+
+# 스케줄러 백엔드: 백그라운드 스레드 대기 / Qt 이벤트 루프의 단일 QTimer / Linux timerfd / 자식 프로세스
+BACKEND_THREAD = "thread"
+BACKEND_QT = "qt"
+BACKEND_TIMERFD = "timerfd"
+BACKEND_PROCESS = "process"
+SCHEDULER_BACKENDS = (BACKEND_THREAD, BACKEND_QT, BACKEND_TIMERFD, BACKEND_PROCESS)
+
+# 기본 스케줄링 엔진
+_engine = HeapScheduler(fire_handler=notify_alarms, missed_handler=notify_missed_alarms)
+
+def set_delivery_handlers(fire_handler: Callable[[List[Alarm], Optional[datetime.datetime]], None],
+                          missed_handler: Optional[Callable[[List[Alarm]], None]] = None):
+    """알람 실행/놓친 알람 전달 방식을 교체합니다. (기본값은 PyQt 알림 창. 헤드리스 실행 등에서 사용)"""
+    _engine.fire_handler = fire_handler
+    _engine.missed_handler = missed_handler
+
 def schedule_alarm(alarm: Alarm):
     """주어진 알람을 스케줄에 등록합니다. (콜백 제거)"""
     if not alarm.enabled:
         logging.debug(f"비활성화된 알람 건너뛰기: {alarm.title}")
         return
 
-    scheduled_jobs_count = 0
-    
-    if alarm.selected_days:
-        day_map = {
-            0: schedule.every().monday,
-            1: schedule.every().tuesday,
-            2: schedule.every().wednesday,
-            3: schedule.every().thursday,
-            4: schedule.every().friday,
-            5: schedule.every().saturday,
-            6: schedule.every().sunday,
-        }
-        for day_index in alarm.selected_days:
-            if day_index in day_map:
-                try:
-                    job = day_map[day_index].at(alarm.time_str).do(run_alarm, alarm=alarm)
-                    job.tag(alarm.id)
-                    scheduled_jobs_count += 1
-                    logging.info(f"  -> {WEEKDAYS[day_index]} at {alarm.time_str} 스케줄됨 (Tag: {alarm.id})")
-                except Exception as e:
-                     logging.error(f"요일별 알람 스케줄 중 오류 ({WEEKDAYS[day_index]}): {e}")
-            else:
-                logging.warning(f"알 수 없는 요일 인덱스: {day_index}")
-    else:
-        # TODO: 이미 지난 시간 처리 개선 필요
-        # 현재: 일단 오늘 해당 시간에 실행되도록 등록하고, run_alarm에서 취소
-        try:
-            job = schedule.every().day.at(alarm.time_str).do(run_alarm, alarm=alarm)
-            job.tag(alarm.id)
-            scheduled_jobs_count += 1
-            logging.info(f"  -> One-time at {alarm.time_str} 스케줄됨 (Tag: {alarm.id})")
-        except Exception as e:
-             logging.error(f"일회성 알람 스케줄 중 오류: {e}")
-
-    if scheduled_jobs_count > 0:
-        repeat_str = alarm.get_repeat_str() if alarm.selected_days else "One-time"
-        logging.info(f"알람 '{alarm.title}' 스케줄 완료 ({scheduled_jobs_count}개 작업 등록). 반복: {repeat_str}")
-    else:
+    try:
+        job = _engine.add_alarm(alarm, run_alarm)
+    except Exception as e:
+        logging.error(f"알람 '{alarm.title}' 스케줄 중 오류: {e}")
         logging.warning(f"알람 '{alarm.title}'에 대해 스케줄된 작업이 없습니다.")
+        return
+    if _child is not None:
+        _child.send_add(alarm)
+
+    repeat_str = alarm.get_repeat_str() if alarm.days_mask else "One-time"
+    logging.info(f"알람 '{alarm.title}' 스케줄 완료 ({alarm.time_str}, 다음 실행: {job.next_run}, Tag: {alarm.id}). 반복: {repeat_str}")
 
 def schedule_alarms(alarms: List[Alarm]):
     """모든 알람을 스케줄에 등록합니다."""
-    schedule.clear() # 기존 스케줄 제거
+    _engine.clear() # 기존 스케줄 제거
+    if _child is not None:
+        _child.send_clear()
     logging.info(f"기존 스케줄 클리어됨. {len(alarms)}개의 알람 스케줄링 시작.")
     for alarm in alarms:
         schedule_alarm(alarm)
-    logging.info("모든 활성 알람 스케줄링 완료.")
-    logging.info(f"현재 스케줄된 작업 ({len(schedule.get_jobs())}개): {schedule.get_jobs()}")
+    logging.info(f"모든 활성 알람 스케줄링 완료. 현재 스케줄된 작업 {_engine.job_count()}개.")
 
-def run_continuously(interval=1):
-    """스케줄러를 백그라운드에서 계속 실행합니다."""
+def run_continuously(clock: Optional[SystemClock] = None):
+    """스케줄러를 백그라운드에서 계속 실행합니다. 다음 알람 시각까지는 깨어나지 않습니다.
+
+    clock을 주면 엔진 시계를 교체합니다. SimulatedClock이면 잠들지 않고 다음 마감 시각으로 바로 이동합니다.
+    """
+    if clock is not None:
+        _engine.clock = clock
     logging.info("스케줄러 백그라운드 스레드 시작.")
-    while not stop_run_continuously.is_set():
-        try:
-            schedule.run_pending()
-            # 일회성 작업 처리는 run_alarm 내부에서 schedule.CancelJob 반환으로 처리됨
-            time.sleep(interval)
-        except Exception as e:
-            logging.exception("스케줄러 실행 중 오류 발생")
-            time.sleep(interval) # 오류 발생 시에도 잠시 대기 후 계속
+    # 일회성 작업 처리는 run_alarm 내부에서 schedule.CancelJob 반환으로 처리됨
+    _engine.run_forever(stop_run_continuously)
     logging.info("스케줄러 백그라운드 스레드 종료.")
 
-def start_scheduler(initial_alarms: List[Alarm]):
-    """초기 알람 목록으로 스케줄러를 설정하고 백그라운드 스레드에서 시작합니다. (콜백 제거)"""
-    global _scheduler_thread
-    if _scheduler_thread is not None:
+def start_scheduler(initial_alarms: List[Alarm], catch_up_grace: float = DEFAULT_CATCH_UP_GRACE_SECONDS,
+                    clock: Optional[SystemClock] = None, fire_workers: int = DEFAULT_FIRE_WORKERS,
+                    backend: str = BACKEND_THREAD, clock_check_interval: Optional[float] = None):
+    """초기 알람 목록으로 스케줄러를 설정하고 선택한 백엔드로 시작합니다. (콜백 제거)
+
+    catch_up_grace: 절전/시계 변경으로 놓친 알람을 늦게라도 전달할 유예 시간(초).
+    clock: 엔진이 사용할 시계. 생략하면 실제 시계(SystemClock), SimulatedClock이면 시뮬레이션 모드.
+    fire_workers: 알람 실행 함수를 돌릴 작업자 스레드 수. 0이면 스케줄러 스레드에서 직접 실행합니다.
+    backend: BACKEND_THREAD(백그라운드 스레드, 헤드리스용),
+             BACKEND_QT(메인 스레드의 단일 QTimer, 스레드 없음. 실행 함수도 메인 스레드에서 실행) 또는
+             BACKEND_TIMERFD(Linux timerfd로 절대 시각까지 커널에서 대기, 시계 변경 시 즉시 재계산.
+             사용할 수 없으면 BACKEND_THREAD로 대체) 또는
+             BACKEND_PROCESS(PyQt 없는 자식 프로세스에서 엔진 실행, 파이프로 변경/실행 메시지 교환. 죽으면 재시작).
+    clock_check_interval: 주면 다음 마감이 멀어도 이 간격(초)마다 깨어나 절전 복귀를 확인합니다. (SystemClock.max_wait)
+             기본값 None은 알람 사이에 깨어나지 않습니다. timerfd 백엔드와 Qt 백엔드의 OS 복귀 알림으로
+             감지할 수 없는 환경(스레드 백엔드 등)에서만 필요합니다.
+    """
+    global _scheduler_thread, _backend, _child
+    if backend not in SCHEDULER_BACKENDS:
+        raise ValueError(f"알 수 없는 스케줄러 백엔드: {backend}")
+    if _scheduler_thread is not None or _backend is not None:
         logging.warning("스케줄러가 이미 실행 중입니다.")
         return
+    if backend == BACKEND_TIMERFD and (clock is not None or not timerfd_scheduler.timerfd_available()):
+        # timerfd는 실제 CLOCK_REALTIME에만 맞출 수 있음 (가상 시계/비 Linux/Python 3.13 미만은 기존 루프)
+        logging.warning("timerfd 백엔드를 사용할 수 없어 스레드 백엔드로 대체합니다.")
+        backend = BACKEND_THREAD
     
-    logging.info("스케줄러 설정 및 시작 중...")
-    schedule.clear()
+    logging.info(f"스케줄러 설정 및 시작 중... (백엔드: {backend})")
+    _engine.catch_up_grace = catch_up_grace
+    _engine.clock = clock or SystemClock(max_wait=clock_check_interval)
+    use_pool = fire_workers > 0 and backend in (BACKEND_THREAD, BACKEND_TIMERFD)
+    _engine.executor = FirePool(fire_workers) if use_pool else None
+    _engine.clear()
     for alarm in initial_alarms:
         schedule_alarm(alarm) # 콜백 없이 호출
     
-    logging.info(f"초기 스케줄된 작업 ({len(schedule.get_jobs())}개): {schedule.get_jobs()}")
+    logging.info(f"초기 스케줄된 작업 {_engine.job_count()}개.")
+
+    if backend == BACKEND_QT:
+        # PyQt5는 이 백엔드를 선택한 경우에만 임포트 (헤드리스 실행 지원)
+        from qt_scheduler import QtTimerBackend
+        _backend = QtTimerBackend(_engine)
+        _backend.start()
+        logging.info("QTimer 스케줄러 백엔드 시작됨.")
+        return
+    if backend == BACKEND_TIMERFD:
+        _backend = timerfd_scheduler.TimerfdBackend(_engine)
+        _backend.start()
+        logging.info("timerfd 스케줄러 백엔드 시작됨.")
+        return
+    if backend == BACKEND_PROCESS:
+        from scheduler_process import ProcessBackend
+        _child = _backend = ProcessBackend(_engine, run_alarm, catch_up_grace)
+        _backend.start()
+        logging.info("자식 프로세스 스케줄러 백엔드 시작됨.")
+        return
 
     # 스레드 중지 이벤트 리셋
     stop_run_continuously.clear()
@@ -122,32 +731,126 @@ def start_scheduler(initial_alarms: List[Alarm]):
 
 def stop_scheduler():
     """스케줄러 백그라운드 스레드를 중지 신호를 보냅니다."""
-    global _scheduler_thread
-    if _scheduler_thread and _scheduler_thread.is_alive():
+    global _scheduler_thread, _backend, _child
+    if _backend is not None:
+        logging.info("스케줄러 백엔드 중지 중...")
+        _backend.stop()
+        _backend = None
+        _child = None
+    elif _scheduler_thread and _scheduler_thread.is_alive():
         logging.info("스케줄러 중지 요청 중...")
         stop_run_continuously.set() # 루프 중지 플래그 설정
+        _engine.wake() # 다음 알람까지 대기 중인 스레드를 깨움
         _scheduler_thread.join() # 스레드가 완전히 종료될 때까지 대기
         _scheduler_thread = None
-        logging.info("스케줄러 중지 완료.")
     else:
         logging.info("스케줄러가 실행 중이지 않음.")
+        return
+    if _engine.executor is not None:
+        _engine.executor.shutdown() # 이미 제출된 알람 실행은 마저 처리
+        _engine.executor = None
+    logging.info("스케줄러 중지 완료.")
 
 _scheduler_thread: Optional[threading.Thread] = None
+# 스레드 외 백엔드 인스턴스 (start()/stop() 제공)
+_backend = None
+# 자식 프로세스 백엔드 (BACKEND_PROCESS일 때 알람 변경을 자식에게 전달)
+_child = None
 
 def update_scheduled_alarm(alarm: Alarm):
     """특정 알람의 스케줄을 업데이트합니다. (콜백 제거)"""
     logging.debug(f"'{alarm.id}' 태그를 가진 스케줄 작업 제거 시도.")
-    schedule.clear(alarm.id)
+    _engine.remove_tag(alarm.id)
+    if _child is not None:
+        _child.send_remove(alarm.id)
     logging.info(f"알람 '{alarm.title}' ({alarm.id}) 스케줄 업데이트 중: 기존 작업 제거 완료.")
     if alarm.enabled:
         schedule_alarm(alarm) # 콜백 없이 호출
     else:
         logging.info(f"알람 '{alarm.title}' ({alarm.id})이(가) 비활성화 상태이므로 스케줄하지 않음.")
-    logging.info(f"업데이트 후 현재 스케줄된 작업 ({len(schedule.get_jobs())}개): {schedule.get_jobs()}")
+    logging.debug(f"업데이트 후 현재 스케줄된 작업 {_engine.job_count()}개.")
 
 def remove_scheduled_alarm(alarm_id: str):
     """특정 ID의 알람을 스케줄에서 제거합니다."""
     logging.debug(f"'{alarm_id}' 태그를 가진 스케줄 작업 제거 시도.")
-    schedule.clear(alarm_id)
+    _engine.remove_tag(alarm_id)
+    if _child is not None:
+        _child.send_remove(alarm_id)
     logging.info(f"알람 ID '{alarm_id}' 스케줄 제거 완료.")
-    logging.info(f"제거 후 현재 스케줄된 작업 ({len(schedule.get_jobs())}개): {schedule.get_jobs()}") 
\ No newline at end of file
+    logging.debug(f"제거 후 현재 스케줄된 작업 {_engine.job_count()}개.")
+
+def get_scheduled_jobs(alarm_id: Optional[str] = None) -> List[AlarmJob]:
+    """스케줄된 작업 목록을 반환합니다. alarm_id를 주면 해당 알람의 작업만 반환합니다."""
+    return _engine.get_jobs(alarm_id)
+
+def scheduled_alarm_ids() -> Set[str]:
+    """현재 스케줄된 알람 ID 집합을 반환합니다."""
+    return _engine.scheduled_tags()
+
+def is_alarm_scheduled(alarm_id: str) -> bool:
+    """알람 ID가 현재 스케줄되어 있는지 반환합니다."""
+    return _engine.has_tag(alarm_id)
+
+def next_occurrences(n: int = 1, until: Optional[datetime.datetime] = None) -> List[Tuple[datetime.datetime, Alarm]]:
+    """앞으로 울릴 알람을 시간순 (시각, 알람) 목록으로 최대 n개 반환합니다. (트레이 툴팁, 목록 표시, 스크립트용)"""
+    return _engine.next_occurrences(n, until)
+
+def watch_store(store: AlarmStore):
+    """AlarmStore의 추가/변경/삭제 이벤트를 받아 해당 알람 하나만 스케줄에 반영합니다."""
+    store.add_listener(on_added=update_scheduled_alarm, on_changed=update_scheduled_alarm,
+                       on_removed=lambda alarm: remove_scheduled_alarm(alarm.id))
+
+def simulate(alarms: List[Alarm], start: Optional[datetime.datetime] = None, days: float = 7,
+             catch_up_grace: float = DEFAULT_CATCH_UP_GRACE_SECONDS) -> List[Tuple[datetime.datetime, str]]:
+    """가상 시계로 start부터 days일 동안의 알람 실행을 재생하고 (실행 시각, 알람 ID) 실행 기록을 반환합니다.
+
+    실제 스케줄러/알림과는 독립된 엔진을 사용하며, 잠들지 않고 각 마감 시각으로 바로 이동합니다.
+    """
+    start = start or datetime.datetime.now()
+    clock = SimulatedClock(start, start + datetime.timedelta(days=days))
+    fire_log: List[Tuple[datetime.datetime, str]] = []
+
+    def record_fire(alarm: Alarm, scheduled_at: Optional[datetime.datetime] = None):
+        fire_log.append((clock.now(), alarm.id))
+        if not alarm.days_mask:
+            return schedule.CancelJob
+
+    def record_missed(missed: List[Alarm]):
+        fire_log.extend((clock.now(), alarm.id) for alarm in missed)
+
+    engine = HeapScheduler(missed_handler=record_missed, catch_up_grace=catch_up_grace, clock=clock)
+    for alarm in alarms:
+        if alarm.enabled:
+            try:
+                engine.add_alarm(alarm, record_fire)
+            except ValueError as e:
+                logging.error(f"시뮬레이션: 알람 '{alarm.title}' 스케줄 중 오류: {e}")
+    engine.run_forever(threading.Event())
+    return fire_log
+
+# 시뮬레이션 모드 실행 예: python scheduler.py --alarms 100000 --days 7 --fire-log fires.csv
+if __name__ == "__main__":
+    import argparse
+    import random
+
+    parser = argparse.ArgumentParser(description="가상 시계로 알람 스케줄러를 재생합니다.")
+    parser.add_argument("--alarms", type=int, default=1000, help="생성할 임의 알람 개수")
+    parser.add_argument("--days", type=float, default=7, help="재생할 기간(일)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--fire-log", help="실행 기록을 저장할 CSV 경로")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    sample_alarms = [
+        Alarm(title=f"Alarm {i}", time_str=f"{rng.randrange(24):02d}:{rng.randrange(60):02d}",
+              selected_days={day for day in range(7) if rng.random() < 0.5})
+        for i in range(args.alarms)
+    ]
+    started = time.perf_counter()
+    fires = simulate(sample_alarms, days=args.days)
+    elapsed = time.perf_counter() - started
+    print(f"{len(sample_alarms)}개 알람, {args.days}일 재생: {len(fires)}회 실행, {elapsed:.2f}초 ({len(fires) / max(elapsed, 1e-9):.0f} fires/s)")
+    if args.fire_log:
+        with open(args.fire_log, "w", encoding="utf-8") as f:
+            for moment, alarm_id in fires:
+                f.write(f"{moment.isoformat()},{alarm_id}\n")
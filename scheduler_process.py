@@ -0,0 +1,253 @@
+"""자식 프로세스 스케줄러.
+
+스케줄링 엔진을 PyQt를 임포트하지 않는 별도 프로세스에서 실행해, GUI 작업(GIL 점유, 멈춤)이 알람 실행 시각에
+영향을 주지 않도록 합니다. 부모와 자식은 표준 입출력 파이프로 한 줄에 하나씩 JSON 메시지를 주고받습니다.
+
+부모 -> 자식:
+    {"op": "add", "id": ..., "t": "HH:MM", "d": 요일 마스크}   추가 또는 교체
+    {"op": "rm", "id": ...}                                      제거
+    {"op": "clear"}                                              전체 제거
+    {"op": "stop"}                                               종료
+자식 -> 부모:
+    {"op": "fire", "ids": [...], "ts": 예정 시각(에포크 초)}      같은 틱에 울린 알람
+    {"op": "missed", "ids": [...]}                               절전/시계 변경으로 놓친 알람
+"""
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import datetime
+import threading
+import subprocess
+from typing import Callable, List, Optional
+
+from alarm import Alarm, time_str_to_minutes
+
+# 자식 프로세스를 다시 시작하기 전 대기 시간(초). 연속으로 죽으면 두 배씩 늘리되 최대값으로 제한
+RESTART_DELAY_SECONDS = 1.0
+MAX_RESTART_DELAY_SECONDS = 30.0
+# 종료 요청 후 자식이 스스로 끝나기를 기다리는 시간(초). 넘기면 강제 종료
+STOP_TIMEOUT_SECONDS = 5.0
+# 패키지(frozen) 실행 파일에서 자식 모드로 진입하기 위한 인자 (main.py가 PyQt 임포트 전에 확인)
+CHILD_FLAG = "--scheduler-child"
+
+def _encode(message: dict) -> bytes:
+    return (json.dumps(message, separators=(",", ":"), ensure_ascii=False) + "\n").encode("utf-8")
+
+def _alarm_message(alarm: Alarm) -> dict:
+    return {"op": "add", "id": alarm.id, "t": alarm.time_str, "d": alarm.days_mask}
+
+def child_command(catch_up_grace: float) -> List[str]:
+    """자식 스케줄러 프로세스 실행 명령을 만듭니다."""
+    if getattr(sys, "frozen", False):
+        # PyInstaller 빌드: 같은 실행 파일을 자식 모드 인자와 함께 실행
+        command = [sys.executable, CHILD_FLAG]
+    else:
+        command = [sys.executable, os.path.abspath(__file__)]
+    return command + ["--catch-up-grace", str(catch_up_grace)]
+
+class ProcessBackend:
+    """스케줄링 엔진을 자식 프로세스에서 실행하고 파이프로 알람 변경/실행 메시지를 주고받는 백엔드.
+
+    부모의 엔진은 타이머 없이 알람 색인(next_occurrences, 조회, 재시작 시 재전송)으로만 쓰입니다.
+    자식이 보낸 실행 메시지는 읽기 스레드에서 job_func와 엔진의 fire_handler/missed_handler로 전달합니다.
+    자식이 예기치 않게 종료되면 엔진의 현재 알람을 모두 다시 보내며 재시작합니다.
+    """
+
+    def __init__(self, engine, job_func: Callable, catch_up_grace: float):
+        self.engine = engine
+        self.job_func = job_func
+        self.catch_up_grace = catch_up_grace
+        self._process: Optional[subprocess.Popen] = None
+        self._write_lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._reader: Optional[threading.Thread] = None
+        self.restart_count = 0
+
+    def start(self):
+        self._stopping.clear()
+        self._spawn()
+        self._reader = threading.Thread(target=self._read_loop, name="AlarmScheduler-pipe", daemon=True)
+        self._reader.start()
+
+    def stop(self):
+        self._stopping.set()
+        process = self._process
+        if process is not None:
+            self._send({"op": "stop"})
+            try:
+                process.stdin.close()
+            except OSError:
+                pass
+            try:
+                process.wait(STOP_TIMEOUT_SECONDS)
+            except subprocess.TimeoutExpired:
+                logging.warning("자식 스케줄러가 응답하지 않아 강제 종료합니다.")
+                process.kill()
+                process.wait()
+        if self._reader is not None:
+            self._reader.join()
+            self._reader = None
+        self._process = None
+
+    def send_add(self, alarm: Alarm):
+        self._send(_alarm_message(alarm))
+
+    def send_remove(self, alarm_id: str):
+        self._send({"op": "rm", "id": alarm_id})
+
+    def send_clear(self):
+        self._send({"op": "clear"})
+
+    def _send(self, message: dict):
+        with self._write_lock:
+            process = self._process
+            if process is None:
+                return
+            try:
+                process.stdin.write(_encode(message))
+                process.stdin.flush()
+            except (OSError, ValueError):
+                # 자식이 죽은 경우: 읽기 스레드가 재시작하면서 전체 알람을 다시 보냄
+                logging.debug(f"자식 스케줄러로 메시지 전송 실패: {message.get('op')}")
+
+    def _spawn(self):
+        command = child_command(self.catch_up_grace)
+        logging.info(f"자식 스케줄러 프로세스 시작: {command}")
+        with self._write_lock:
+            self._process = subprocess.Popen(
+                command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL if sys.stderr is None else None, # 창 모드 빌드는 stderr 없음
+                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0), # Windows 콘솔 창 숨김
+            )
+        # 엔진 잠금 안에서 현재 알람을 모두 보내 스냅샷과 이후 변경 사이의 누락을 막음
+        with self.engine.lock:
+            alarms = [job.alarm for job in self.engine.get_jobs()]
+            self._send({"op": "clear"})
+            for alarm in alarms:
+                self.send_add(alarm)
+        logging.info(f"자식 스케줄러에 알람 {len(alarms)}개 전송 완료.")
+
+    def _read_loop(self):
+        delay = RESTART_DELAY_SECONDS
+        while True:
+            started = time.monotonic()
+            for line in self._process.stdout:
+                try:
+                    self._handle_message(json.loads(line))
+                except Exception:
+                    logging.exception(f"자식 스케줄러 메시지 처리 중 오류: {line!r}")
+            if self._stopping.is_set():
+                break
+            exit_code = self._process.wait()
+            if time.monotonic() - started > MAX_RESTART_DELAY_SECONDS:
+                delay = RESTART_DELAY_SECONDS # 한동안 정상 동작했으면 대기 시간 초기화
+            logging.error(f"자식 스케줄러가 종료되었습니다 (종료 코드 {exit_code}). {delay:.0f}초 후 재시작합니다.")
+            if self._stopping.wait(delay):
+                break
+            delay = min(delay * 2, MAX_RESTART_DELAY_SECONDS)
+            self.restart_count += 1
+            try:
+                self._spawn()
+            except OSError as e:
+                logging.error(f"자식 스케줄러 재시작 실패: {e}")
+                break
+
+    def _alarms_for(self, alarm_ids: List[str]) -> List[Alarm]:
+        alarms = []
+        for alarm_id in alarm_ids:
+            jobs = self.engine.get_jobs(alarm_id)
+            if jobs:
+                alarms.append(jobs[0].alarm)
+        return alarms
+
+    def _discard_one_time(self, alarms: List[Alarm]):
+        # 자식은 일회성 알람을 실행 후 이미 제거했으므로 부모 색인에서도 제거
+        for alarm in alarms:
+            if not alarm.days_mask:
+                self.engine.remove_tag(alarm.id)
+
+    def _handle_message(self, message: dict):
+        op = message.get("op")
+        if op == "fire":
+            alarms = self._alarms_for(message["ids"])
+            scheduled_at = datetime.datetime.fromtimestamp(message["ts"])
+            for alarm in alarms:
+                try:
+                    self.job_func(alarm, scheduled_at=scheduled_at)
+                except Exception:
+                    logging.exception(f"알람 실행 중 오류 발생: {alarm.title}")
+            self._discard_one_time(alarms)
+            if alarms and self.engine.fire_handler is not None:
+                self.engine.fire_handler(alarms, scheduled_at)
+        elif op == "missed":
+            alarms = self._alarms_for(message["ids"])
+            self._discard_one_time(alarms)
+            if alarms and self.engine.missed_handler is not None:
+                self.engine.missed_handler(alarms)
+        else:
+            logging.warning(f"알 수 없는 자식 스케줄러 메시지: {op}")
+
+def child_main(argv: Optional[List[str]] = None) -> int:
+    """자식 프로세스 진입점: 표준 입력으로 알람 변경을 받고, 실행 시각이 되면 표준 출력으로 알립니다."""
+    # PyQt5를 임포트하지 않도록 scheduler만 사용 (notification은 부모에서 표시)
+    import schedule
+    from scheduler import HeapScheduler, DEFAULT_CATCH_UP_GRACE_SECONDS
+
+    parser = argparse.ArgumentParser(description="알람 스케줄러 자식 프로세스")
+    parser.add_argument(CHILD_FLAG, action="store_true")
+    parser.add_argument("--catch-up-grace", type=float, default=DEFAULT_CATCH_UP_GRACE_SECONDS)
+    args, _ = parser.parse_known_args(argv)
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s [%(levelname)s] [scheduler-child] %(message)s')
+
+    out = sys.stdout.buffer
+    out_lock = threading.Lock()
+
+    def emit(message: dict):
+        with out_lock:
+            out.write(_encode(message))
+            out.flush()
+
+    def fire(alarms: List[Alarm], scheduled_at: Optional[datetime.datetime] = None):
+        emit({"op": "fire", "ids": [alarm.id for alarm in alarms], "ts": scheduled_at.timestamp() if scheduled_at else 0.0})
+
+    def missed(alarms: List[Alarm]):
+        emit({"op": "missed", "ids": [alarm.id for alarm in alarms]})
+
+    def run_job(alarm: Alarm, scheduled_at: Optional[datetime.datetime] = None):
+        if not alarm.days_mask:
+            return schedule.CancelJob
+
+    engine = HeapScheduler(fire_handler=fire, missed_handler=missed, catch_up_grace=args.catch_up_grace)
+    stop_event = threading.Event()
+    runner = threading.Thread(target=engine.run_forever, args=(stop_event,), daemon=True)
+    runner.start()
+
+    for line in sys.stdin.buffer:
+        try:
+            message = json.loads(line)
+            op = message.get("op")
+            if op == "add":
+                engine.remove_tag(message["id"])
+                alarm = Alarm.from_parts(message["id"], message["id"], time_str_to_minutes(message["t"]), message["d"])
+                engine.add_alarm(alarm, run_job)
+            elif op == "rm":
+                engine.remove_tag(message["id"])
+            elif op == "clear":
+                engine.clear()
+            elif op == "stop":
+                break
+        except Exception:
+            logging.exception(f"잘못된 명령: {line!r}")
+    # 부모가 종료를 요청했거나 파이프가 닫힘(부모 종료)
+    stop_event.set()
+    engine.wake()
+    runner.join()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(child_main())
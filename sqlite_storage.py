@@ -0,0 +1,185 @@
+import os
+import logging
+import sqlite3
+import threading
+from typing import Dict, List, Optional
+
+from alarm import Alarm
+import storage
+
+# SQLite 데이터베이스 파일 (alarms.json과 같은 디렉토리)
+DB_FILE = os.path.join(storage.APP_DATA_DIR, "alarms.db")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS alarms (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    minute_of_day INTEGER NOT NULL,
+    days_mask INTEGER NOT NULL,
+    enabled INTEGER NOT NULL,
+    sound_path TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_alarms_minute ON alarms(minute_of_day);
+CREATE INDEX IF NOT EXISTS idx_alarms_days ON alarms(days_mask);
+CREATE INDEX IF NOT EXISTS idx_alarms_enabled ON alarms(enabled, minute_of_day); -- 활성 알람의 시각 범위 조회도 처리
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+_UPSERT = """
+INSERT INTO alarms (id, title, minute_of_day, days_mask, enabled, sound_path) VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+    title = excluded.title, minute_of_day = excluded.minute_of_day, days_mask = excluded.days_mask,
+    enabled = excluded.enabled, sound_path = excluded.sound_path
+"""
+
+_connection: Optional[sqlite3.Connection] = None
+# 마지막으로 반영된 행 (알람 ID -> 행 튜플). save_alarms에서 바뀐 행만 쓰기 위해 사용
+_saved_rows: Dict[str, tuple] = {}
+_lock = threading.RLock()
+
+def _alarm_row(alarm: Alarm) -> tuple:
+    return (alarm.id, alarm.title, alarm.minute_of_day, alarm.days_mask, int(alarm.enabled), alarm.sound_path)
+
+def _row_alarm(row: tuple) -> Alarm:
+    alarm_id, title, minute_of_day, days_mask, enabled, sound_path = row
+    return Alarm.from_parts(alarm_id, title, minute_of_day, days_mask, bool(enabled), sound_path)
+
+def _connect() -> sqlite3.Connection:
+    """데이터베이스를 열고 (처음이면) 스키마 생성과 alarms.json 이전을 수행합니다."""
+    global _connection
+    if _connection is not None:
+        return _connection
+    storage._ensure_dir_exists()
+    # 저장 작업자 스레드에서도 쓰므로 스레드 검사 대신 _lock으로 직렬화
+    connection = sqlite3.connect(DB_FILE, check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL") # 쓰기가 읽기를 막지 않고, 커밋마다 전체 파일을 다시 쓰지 않음
+    connection.execute("PRAGMA synchronous=NORMAL") # WAL에서는 전원 장애 시 마지막 트랜잭션만 손실될 수 있음
+    connection.executescript(_SCHEMA)
+    _connection = connection
+    _migrate_from_json(connection)
+    return connection
+
+def _migrate_from_json(connection: sqlite3.Connection):
+    """기존 alarms.json(과 저널)의 알람을 한 번만 가져옵니다. 원본 파일은 읽기만 하고 백업으로 남겨 둡니다.
+
+    파일을 읽지 못하면 이전 완료 표시를 남기지 않으므로 다음 시작 때 다시 시도합니다.
+    """
+    if connection.execute("SELECT value FROM meta WHERE key = 'migrated_from_json'").fetchone():
+        return
+    alarms = []
+    if os.path.exists(storage.ALARMS_FILE) or os.path.exists(storage.JOURNAL_FILE):
+        try:
+            alarms = storage._read_json_alarms()
+        except (OSError, ValueError) as e:
+            logging.error(f"SQLite 이전: alarms.json을 읽을 수 없어 이전을 다음 시작으로 미룹니다: {e}", exc_info=True)
+            return
+    with connection:
+        rows = []
+        for alarm in alarms:
+            try:
+                rows.append(_alarm_row(alarm))
+            except ValueError as e:
+                logging.error(f"SQLite 이전: 알람 '{alarm.title}' 건너뜀 ({e})")
+        connection.executemany(_UPSERT, rows)
+        connection.execute("INSERT INTO meta (key, value) VALUES ('migrated_from_json', ?)", (str(len(rows)),))
+    if alarms:
+        logging.info(f"alarms.json의 알람 {len(rows)}개를 SQLite({DB_FILE})로 이전했습니다.")
+
+def load_alarms() -> List[Alarm]:
+    """데이터베이스의 모든 알람을 추가된 순서대로 불러옵니다."""
+    global _saved_rows
+    logging.info(f"알람 로딩 시도 경로: {DB_FILE}")
+    try:
+        with _lock:
+            rows = _connect().execute(
+                "SELECT id, title, minute_of_day, days_mask, enabled, sound_path FROM alarms ORDER BY rowid").fetchall()
+            _saved_rows = {row[0]: row for row in rows}
+        logging.info(f"최종 변환된 알람 개수: {len(rows)}")
+        return [_row_alarm(row) for row in rows]
+    except sqlite3.Error as e:
+        logging.error(f"SQLite 알람 로딩 실패 ({DB_FILE}): {e}. 빈 목록을 반환합니다.", exc_info=True)
+        return []
+
+def save_alarms(alarms: List[Alarm]):
+    """마지막으로 반영된 상태와 비교해 바뀐 알람만 upsert하고, 없어진 알람은 삭제합니다. (한 트랜잭션)"""
+    global _saved_rows
+    try:
+        with _lock:
+            rows = {}
+            for alarm in alarms:
+                try:
+                    rows[alarm.id] = _alarm_row(alarm)
+                except ValueError as e:
+                    logging.error(f"알람 '{alarm.title}' 저장 건너뜀: {e}")
+            changed = [row for alarm_id, row in rows.items() if _saved_rows.get(alarm_id) != row]
+            removed = [(alarm_id,) for alarm_id in _saved_rows if alarm_id not in rows]
+            if not changed and not removed:
+                logging.debug("저장할 알람 변경 사항이 없습니다.")
+                return
+            connection = _connect()
+            with connection:
+                connection.executemany(_UPSERT, changed)
+                connection.executemany("DELETE FROM alarms WHERE id = ?", removed)
+            _saved_rows = rows
+        logging.info(f"SQLite 알람 저장 완료: 변경/추가 {len(changed)}개, 삭제 {len(removed)}개.")
+    except sqlite3.Error as e:
+        logging.error(f"SQLite 알람 저장 실패: {e}", exc_info=True)
+
+def save_alarm(alarm: Alarm):
+    """알람 하나를 upsert합니다."""
+    try:
+        row = _alarm_row(alarm)
+    except ValueError as e:
+        logging.error(f"알람 '{alarm.title}' 저장 건너뜀: {e}")
+        return
+    try:
+        with _lock:
+            if _saved_rows.get(alarm.id) == row:
+                return
+            connection = _connect()
+            with connection:
+                connection.execute(_UPSERT, row)
+            _saved_rows[alarm.id] = row
+    except sqlite3.Error as e:
+        logging.error(f"SQLite 알람 저장 실패: {e}", exc_info=True)
+
+def delete_alarm(alarm_id: str):
+    """알람 하나를 삭제합니다."""
+    try:
+        with _lock:
+            connection = _connect()
+            with connection:
+                connection.execute("DELETE FROM alarms WHERE id = ?", (alarm_id,))
+            _saved_rows.pop(alarm_id, None)
+    except sqlite3.Error as e:
+        logging.error(f"SQLite 알람 삭제 실패: {e}", exc_info=True)
+
+def alarms_between(start_minute: int, end_minute: int, weekday: Optional[int] = None,
+                   enabled: Optional[bool] = None) -> List[Alarm]:
+    """자정 기준 분 [start_minute, end_minute) 범위의 알람을 시각순으로 반환합니다. (색인 사용)
+
+    weekday(월=0 ~ 일=6)를 주면 그 요일에 울리는 반복 알람과 일회성 알람(마스크 0)만 포함합니다.
+    """
+    query = "SELECT id, title, minute_of_day, days_mask, enabled, sound_path FROM alarms WHERE minute_of_day >= ? AND minute_of_day < ?"
+    params: list = [start_minute, end_minute]
+    if weekday is not None:
+        query += " AND (days_mask = 0 OR (days_mask & ?) != 0)"
+        params.append(1 << weekday)
+    if enabled is not None:
+        query += " AND enabled = ?"
+        params.append(int(enabled))
+    query += " ORDER BY minute_of_day"
+    with _lock:
+        rows = _connect().execute(query, params).fetchall()
+    return [_row_alarm(row) for row in rows]
+
+def close():
+    """데이터베이스 연결을 닫습니다. (WAL 내용은 닫을 때 본 파일에 반영됨)"""
+    global _connection
+    with _lock:
+        if _connection is not None:
+            _connection.close()
+            _connection = None
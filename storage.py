@@ -1,32 +1,55 @@
 import json
 import os
+import datetime
+import re
+import shutil
 import logging
-from typing import List, Dict, Any
+import threading
+from typing import List, Dict, Any, Optional, Iterator, Sequence
 from alarm import Alarm
+import alarm_snapshot
 import uuid
 
 # 저장될 앱 이름 및 파일 이름 정의
 APP_NAME = "AlarmReminderPAAK"
 FILE_NAME = "alarms.json"
 
+def _data_root() -> str:
+    """앱 데이터 상위 디렉토리. Windows는 %LOCALAPPDATA%, 그 외(헤드리스 Linux 등)는 XDG_DATA_HOME 또는 ~/.local/share."""
+    return (os.getenv('LOCALAPPDATA') or os.getenv('XDG_DATA_HOME')
+            or os.path.join(os.path.expanduser('~'), '.local', 'share'))
+
 # 데이터 저장 경로 설정
-APP_DATA_DIR = os.path.join(os.getenv('LOCALAPPDATA'), APP_NAME)
+APP_DATA_DIR = os.path.join(_data_root(), APP_NAME)
 ALARMS_FILE = os.path.join(APP_DATA_DIR, FILE_NAME)
+# 마지막 스냅샷 이후의 변경 기록 (한 줄에 JSON 레코드 하나씩 추가만 함)
+JOURNAL_FILE = os.path.join(APP_DATA_DIR, "alarms.journal")
+# 저널 레코드가 이 값과 알람 수 중 큰 값을 넘으면 스냅샷으로 압축
+JOURNAL_COMPACT_MIN_RECORDS = 256
+# JSON 파싱 없이 시작하기 위한 바이너리 캐시 (alarm_snapshot). 원본이 바뀌면 무시되고 다시 만들어짐
+BINARY_SNAPSHOT_FILE = os.path.join(APP_DATA_DIR, "alarms.bin")
+BINARY_SNAPSHOT_ENABLED = os.getenv('ALARM_BINARY_SNAPSHOT', '1') != '0'
+# 읽을 수 없는 레코드를 옮겨 두는 파일 (한 줄에 하나씩, 원문과 오류 내용)
+QUARANTINE_FILE = os.path.join(APP_DATA_DIR, "alarms.quarantine")
+
+# 스트리밍 로더: 한 번에 읽는 크기와 레코드 하나의 최대 크기 (이보다 길면 깨진 레코드로 취급)
+_READ_CHUNK_SIZE = 64 * 1024
+_MAX_RECORD_SIZE = 1024 * 1024
+# 다음 레코드의 시작 위치 (깨진 레코드를 건너뛸 때 사용)
+_RECORD_BOUNDARY = re.compile(r',\s*(?=\{)')
+
+# 저장 파일 스키마 버전. 1: 최상위 배열(repeat 필드, ID 없는 레코드 가능), 2: {"schema_version", "alarms"} 객체
+SCHEMA_VERSION = 2
+_SCHEMA_HEADER = re.compile(r'\{\s*"schema_version"\s*:\s*(\d+)\s*,\s*"alarms"\s*:\s*\[')
+
+# 저장 방식: JSON 스냅샷+저널(기본) 또는 SQLite (ALARM_STORAGE_BACKEND=sqlite, 대량 알람용)
+STORAGE_JSON = "json"
+STORAGE_SQLITE = "sqlite"
+STORAGE_BACKEND = os.getenv('ALARM_STORAGE_BACKEND', STORAGE_JSON)
 
 def get_storage_path() -> str:
     """로컬 AppData 디렉토리에 있는 저장 파일의 전체 경로를 반환합니다."""
-    # %LOCALAPPDATA% 환경 변수 사용
-    local_appdata = os.environ.get('LOCALAPPDATA')
-    if not local_appdata:
-        # 환경 변수가 없는 경우 (매우 드문 경우), 현재 디렉토리 사용
-        print("경고: LOCALAPPDATA 환경 변수를 찾을 수 없습니다. 현재 디렉토리에 저장합니다.")
-        return FILE_NAME 
-        
-    # 앱 데이터 폴더 경로 생성
-    app_data_dir = os.path.join(local_appdata, APP_NAME)
-    
-    # 파일 경로 반환
-    return os.path.join(app_data_dir, FILE_NAME)
+    return ALARMS_FILE
 
 # STORAGE_FILE 변수를 함수 호출 결과로 대체
 # STORAGE_FILE = "alarms.json"
@@ -42,95 +65,527 @@ def _ensure_dir_exists():
             # 여기서 오류를 다시 발생시키거나, 기본 경로를 사용하도록 처리할 수 있음
             raise # 일단 오류 발생시켜서 문제 인지하도록 함
 
-def load_alarms() -> List[Alarm]:
-    """저장된 알람 목록을 파일에서 불러옵니다."""
+def _alarm_record(alarm: Alarm) -> Dict[str, Any]:
+    """Alarm 객체를 JSON 직렬화 가능한 레코드로 변환합니다. (스냅샷/저널 공통 형식)"""
+    return {
+        'id': alarm.id,
+        'title': alarm.title,
+        'time_str': alarm.time_str,
+        'selected_days': sorted(alarm.selected_days), # set을 정렬된 list로 변환 (변경 비교가 안정적이도록)
+        'enabled': alarm.enabled,
+        'sound_path': alarm.sound_path # sound_path 저장 추가
+    }
+
+# 마지막으로 디스크에 반영된 상태 (알람 ID -> 레코드). None이면 아직 로드/저장 전이므로 다음 저장은 전체 스냅샷
+_saved_records: Optional[Dict[str, Dict[str, Any]]] = None
+_journal_records = 0 # 마지막 스냅샷 이후 저널에 추가된 레코드 수
+_snapshot_stale = False # 이전 버전 데이터(ID 없음, repeat 필드)나 손상된 저널을 읽은 경우: 다음 저장 때 스냅샷으로 다시 씀
+_storage_lock = threading.Lock()
+# 바이너리 캐시에서 로드한 경우 _saved_records 대신 이 스냅샷을 유지하고, 처음 저장할 때 레코드로 펼침
+_binary_snapshot: Optional[alarm_snapshot.AlarmSnapshot] = None
+# 읽을 수 없는 알람 파일을 백업하지 못한 경우: 원본을 덮어쓰지 않도록 모든 저장을 거부
+_writes_blocked = False
+
+def _saved_state() -> Optional[Dict[str, Dict[str, Any]]]:
+    """마지막으로 디스크에 반영된 레코드. 바이너리 캐시에서 로드했으면 이때 펼칩니다. (_storage_lock 안에서 호출)"""
+    global _saved_records, _binary_snapshot
+    if _saved_records is None and _binary_snapshot is not None:
+        snapshot, _binary_snapshot = _binary_snapshot, None
+        _saved_records = {}
+        for i in range(len(snapshot)):
+            record = snapshot.record(i)
+            _saved_records[record['id']] = record
+        snapshot.close()
+    return _saved_records
+
+def _write_binary_snapshot(records: List[Dict[str, Any]], journal_records: int):
+    """현재 JSON 파일 상태에 대한 바이너리 캐시를 씁니다. 실패해도 JSON이 원본이므로 경고만 남깁니다."""
+    global _binary_snapshot
+    if not BINARY_SNAPSHOT_ENABLED:
+        return
+    if _binary_snapshot is not None:
+        _binary_snapshot.close()
+        _binary_snapshot = None
+    try:
+        key = alarm_snapshot.source_key(ALARMS_FILE, JOURNAL_FILE)
+        alarm_snapshot.write_snapshot(BINARY_SNAPSHOT_FILE, records, key, journal_records)
+    except (OSError, ValueError, KeyError) as e:
+        logging.warning(f"바이너리 스냅샷 캐시 저장 실패: {e}")
+
+def _read_journal(stats: Dict[str, Any]) -> Dict[str, Optional[Dict[str, Any]]]:
+    """저널의 변경 레코드를 순서대로 모아 (알람 ID -> 최종 레코드, 삭제면 None)으로 반환합니다.
+
+    쓰기 도중 중단되어 잘린 마지막 줄은 건너뜁니다. (최대 마지막 레코드 하나만 손실)
+    """
+    overrides: Dict[str, Optional[Dict[str, Any]]] = {}
+    if not os.path.exists(JOURNAL_FILE):
+        return overrides
+    with open(JOURNAL_FILE, 'r', encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+                if entry['op'] == 'put':
+                    overrides[entry['alarm']['id']] = entry['alarm']
+                elif entry['op'] == 'del':
+                    overrides[entry['id']] = None
+                else:
+                    raise ValueError(f"알 수 없는 저널 op: {entry['op']}")
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+                logging.warning(f"저널({JOURNAL_FILE}) {line_no}번째 줄을 건너뜁니다: {e}")
+                stats['journal_skipped'] += 1
+                continue
+            stats['journal_applied'] += 1
+    return overrides
+
+def _quarantine(raw: str, error: str, stats: Dict[str, Any]):
+    """읽을 수 없는 레코드를 버리지 않고 격리 파일에 남깁니다. (수동 복구용)"""
+    stats['quarantined'] += 1
+    if stats['read_only']:
+        # 읽기 전용 로드(SQLite 이전 등)는 원본을 그대로 두므로 격리 파일에 쓰지 않음
+        logging.warning(f"알람 레코드를 건너뜁니다: {error}")
+        return
+    logging.warning(f"알람 레코드를 건너뛰고 격리합니다 ({QUARANTINE_FILE}): {error}")
+    try:
+        with open(QUARANTINE_FILE, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({'error': error, 'raw': raw}, ensure_ascii=False) + "\n")
+    except OSError as e:
+        logging.error(f"격리 파일 기록 실패: {e}")
+
+class _SnapshotReader:
+    """스냅샷 파일을 레코드 단위로 디코딩하는 스트리밍 리더.
+
+    파일 전체를 읽지 않고 _READ_CHUNK_SIZE씩 읽어 raw_decode로 레코드 하나씩 해석하므로, 메모리 사용량은
+    파일 크기가 아니라 레코드 크기에 비례합니다. 문법이 깨진 레코드는 다음 레코드 경계(',' 다음 '{')까지
+    건너뛰어 격리하고 나머지는 계속 읽습니다.
+    """
+
+    def __init__(self, f, stats: Dict[str, Any]):
+        self._file = f
+        self._stats = stats
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._loaded_records: Optional[List[Any]] = None # 스트리밍할 수 없는 형식을 통째로 읽은 경우의 레코드
+
+    def _fill(self) -> bool:
+        # 버퍼에 다음 청크를 덧붙임 (이미 처리한 앞부분은 버림). 더 읽을 것이 없으면 False
+        if self._eof:
+            return False
+        chunk = self._file.read(_READ_CHUNK_SIZE)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer, self._pos = self._buffer[self._pos:] + chunk, 0
+        return True
+
+    def _skip_ws(self) -> bool:
+        # 공백을 건너뛰고 다음 문자가 있으면 True
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in " \t\r\n":
+                self._pos += 1
+            if self._pos < len(self._buffer) or not self._fill():
+                return self._pos < len(self._buffer)
+
+    def read_header(self) -> Optional[int]:
+        """스키마 버전을 읽고 레코드 배열 시작 위치로 이동합니다. 빈 파일이면 None.
+
+        버전 1은 최상위 배열, 버전 2부터는 {"schema_version": N, "alarms": [...]} 형식입니다.
+        """
+        if not self._skip_ws():
+            return None
+        if self._buffer[self._pos] == '[':
+            self._pos += 1
+            return 1
+        match = _SCHEMA_HEADER.match(self._buffer, self._pos)
+        while match is None and len(self._buffer) - self._pos < _MAX_RECORD_SIZE and self._fill():
+            match = _SCHEMA_HEADER.match(self._buffer, self._pos)
+        if match is None:
+            return self._load_whole()
+        self._pos = match.end()
+        return int(match.group(1))
+
+    def _load_whole(self) -> int:
+        # 키 순서가 다른 객체(키를 정렬하는 도구로 편집한 파일 등)는 스트리밍 대신 파일 전체를 한 번에 해석
+        logging.warning("알람 파일의 schema_version이 첫 키가 아니어서 파일 전체를 한 번에 읽습니다.")
+        data = json.loads(self._buffer[self._pos:] + self._file.read())
+        if not isinstance(data, dict) or not isinstance(data.get('alarms'), list):
+            raise ValueError("알람 파일 형식을 알 수 없습니다. (alarms 목록 없음)")
+        version = data.get('schema_version')
+        if not isinstance(version, int):
+            raise ValueError(f"알람 파일의 schema_version이 올바르지 않습니다: {version!r}")
+        self._loaded_records = data['alarms']
+        return version
+
+    def records(self) -> Iterator[Any]:
+        """배열의 레코드를 하나씩 돌려줍니다. (read_header 다음에 호출)"""
+        if self._loaded_records is not None:
+            yield from self._loaded_records
+            return
+        while self._skip_ws():
+            char = self._buffer[self._pos]
+            if char == ']':
+                return
+            if char == ',':
+                self._pos += 1
+                continue
+            try:
+                record, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as e:
+                # 레코드가 청크 경계에서 잘렸을 수 있으므로 최대 레코드 크기까지 더 읽어 다시 시도
+                if len(self._buffer) - self._pos < _MAX_RECORD_SIZE and self._fill():
+                    continue
+                # 문법 오류: 다음 레코드 경계까지 건너뛰고 격리
+                boundary = _RECORD_BOUNDARY.search(self._buffer, self._pos + 1)
+                while boundary is None and len(self._buffer) - self._pos < _MAX_RECORD_SIZE and self._fill():
+                    boundary = _RECORD_BOUNDARY.search(self._buffer, self._pos + 1)
+                skip_to = boundary.start() if boundary else len(self._buffer)
+                _quarantine(self._buffer[self._pos:skip_to], f"JSON 문법 오류: {e.msg}", self._stats)
+                self._pos = skip_to
+                continue
+            self._pos = end
+            yield record
+
+def _migrate_v1(data: Any) -> Any:
+    """버전 1 -> 2: 'repeat' 필드를 selected_days로 바꾸고, 없는 필드는 기본값으로, 없는 ID는 새로 만들어 채움."""
+    if not isinstance(data, dict):
+        return data # 형식 오류는 변환 단계에서 격리
+    selected_days = data.get('selected_days', [])
+    repeat = data.pop('repeat', None)
+    if repeat == 'Daily':
+        selected_days = list(range(7))
+    # 이전 'Weekly'는 단순화되었으므로 특정 요일 지정 불가 -> 무시
+    if not data.get('id'):
+        data['id'] = str(uuid.uuid4())
+        logging.warning(f"알람 데이터에 ID가 없어 새로 생성: {data.get('title')} -> {data['id']}")
+    return {
+        'id': data['id'],
+        'title': data.get('title', 'Untitled Alarm'),
+        'time_str': data.get('time_str', '00:00'),
+        'selected_days': selected_days,
+        'enabled': data.get('enabled', True),
+        'sound_path': data.get('sound_path'),
+    }
+
+# 스키마 버전 N의 레코드를 N+1로 바꾸는 함수. 스키마를 바꿀 때 SCHEMA_VERSION을 올리고 여기에 추가
+_MIGRATIONS = {
+    1: _migrate_v1,
+}
+
+def _migrate_records(records: Iterator[Any], version: int) -> Iterator[Any]:
+    """이전 스키마 레코드를 현재 스키마(SCHEMA_VERSION)로 하나씩 변환합니다."""
+    steps = [_MIGRATIONS[v] for v in range(version, SCHEMA_VERSION)]
+    for data in records:
+        for step in steps:
+            data = step(data)
+        yield data
+
+def _record_to_alarm(data: Any, stats: Dict[str, Any]) -> Optional[Alarm]:
+    """현재 스키마의 레코드 하나를 Alarm으로 변환합니다. 값이 잘못된 레코드는 격리하고 None을 반환합니다."""
+    try:
+        # 생성자가 시각 형식을 검사함 (잘못되면 ValueError)
+        return Alarm(id=data['id'], title=data['title'], time_str=data['time_str'],
+                     selected_days=set(data['selected_days']), enabled=data['enabled'],
+                     sound_path=data['sound_path'])
+    except (TypeError, ValueError, KeyError, AttributeError) as e:
+        _quarantine(json.dumps(data, ensure_ascii=False, default=str), f"잘못된 알람 데이터: {e!r}", stats)
+        return None
+
+def _new_load_stats(read_only: bool = False) -> Dict[str, Any]:
+    return {'journal_applied': 0, 'journal_skipped': 0, 'quarantined': 0, 'schema_version': SCHEMA_VERSION,
+            'read_only': read_only}
+
+def _iter_json_alarms(stats: Dict[str, Any]) -> Iterator[Alarm]:
+    """스냅샷을 스트리밍으로 읽으며 저널 변경분을 덮어써 Alarm을 하나씩 돌려줍니다.
+
+    이전 스키마 파일이면 레코드를 읽으면서 변환하고 stats['schema_version']에 원래 버전을 기록합니다.
+    (저널은 항상 현재 스키마로 기록됨)
+    """
+    overrides = _read_journal(stats)
+    seen = set()
+    if os.path.exists(ALARMS_FILE):
+        with open(ALARMS_FILE, 'r', encoding='utf-8') as f:
+            reader = _SnapshotReader(f, stats)
+            version = reader.read_header()
+            if version is None:
+                logging.warning(f"알람 파일({ALARMS_FILE})이 비어 있습니다.")
+                version = SCHEMA_VERSION
+            records = reader.records()
+            if version < SCHEMA_VERSION:
+                logging.warning(f"알람 파일 스키마 버전 {version} -> {SCHEMA_VERSION} 변환")
+                records = _migrate_records(records, version)
+            elif version > SCHEMA_VERSION:
+                logging.warning(f"알람 파일 스키마 버전({version})이 이 버전({SCHEMA_VERSION})보다 새롭습니다. 알 수 있는 필드만 읽습니다.")
+            stats['schema_version'] = version
+            for data in records:
+                alarm_id = data.get('id') if isinstance(data, dict) else None
+                if alarm_id in overrides:
+                    # 저널에서 바뀐 레코드는 스냅샷 위치에서 최종 상태로 교체 (삭제됐으면 제외)
+                    seen.add(alarm_id)
+                    data = overrides[alarm_id]
+                    if data is None:
+                        continue
+                alarm = _record_to_alarm(data, stats)
+                if alarm is not None:
+                    yield alarm
+    # 스냅샷 이후 새로 추가된 알람
+    for alarm_id, data in overrides.items():
+        if data is not None and alarm_id not in seen:
+            alarm = _record_to_alarm(data, stats)
+            if alarm is not None:
+                yield alarm
+
+def iter_alarms() -> Iterator[Alarm]:
+    """저장된 알람을 파일 전체를 메모리에 올리지 않고 하나씩 돌려줍니다. (대용량 내보내기/검사용)"""
+    if STORAGE_BACKEND == STORAGE_SQLITE:
+        import sqlite_storage
+        return iter(sqlite_storage.load_alarms())
+    # 읽기 전용: 잘못된 레코드는 건너뛰기만 함 (격리는 load_alarms에서 한 번만)
+    return _iter_json_alarms(_new_load_stats(read_only=True))
+
+def _read_json_alarms() -> List[Alarm]:
+    """알람 파일과 저널을 읽기만 합니다. (격리 파일, 바이너리 캐시, 스키마 변환 결과를 쓰지 않고 저장 상태도 바꾸지 않음)
+
+    파일을 읽을 수 없으면 OSError/ValueError를 그대로 올립니다. (SQLite 이전처럼 실패 여부를 알아야 하는 경우용)
+    """
+    stats = _new_load_stats(read_only=True)
+    alarms = list(_iter_json_alarms(stats))
+    if stats['quarantined']:
+        logging.warning(f"읽을 수 없는 알람 레코드 {stats['quarantined']}개를 제외했습니다. (원본 파일은 그대로 둠)")
+    return alarms
+
+def _load_json_alarms() -> List[Alarm]:
+    """저장된 알람 목록을 스냅샷 파일과 변경 저널에서 불러옵니다. 잘못된 레코드는 격리하고 나머지는 모두 불러옵니다."""
+    global _saved_records, _journal_records, _snapshot_stale, _binary_snapshot, _writes_blocked
     logging.info(f"알람 로딩 시도 경로: {ALARMS_FILE}") # 로그 메시지 명확화
-    if not os.path.exists(ALARMS_FILE):
+    _writes_blocked = False
+    if not os.path.exists(ALARMS_FILE) and not os.path.exists(JOURNAL_FILE):
         logging.warning(f"알람 파일({ALARMS_FILE})을 찾을 수 없습니다. 빈 목록을 반환합니다.")
+        _saved_records, _journal_records, _snapshot_stale = {}, 0, False
         return []
+    stats = _new_load_stats()
     try:
-        # 파일 내용 읽기 및 로깅
-        with open(ALARMS_FILE, 'r', encoding='utf-8') as f:
-            raw_content = f.read()
-            logging.debug(f"읽어온 파일 내용 (raw): {raw_content}") # raw 내용 로그 추가
-            # 파일이 비어있는 경우 처리
-            if not raw_content.strip():
-                logging.warning(f"알람 파일({ALARMS_FILE})이 비어 있습니다. 빈 목록을 반환합니다.")
-                return []
-            alarms_data = json.loads(raw_content) # raw_content 사용
-            logging.debug(f"JSON 파싱 완료 데이터: {alarms_data}") # 파싱된 데이터 로그 추가
-            
-        alarms = []
-        logging.debug("Alarm 객체 변환 시작...") # 변환 시작 로그
-        for i, data in enumerate(alarms_data):
-            logging.debug(f"  변환 시도 데이터 [{i}]: {data}") # 각 데이터 항목 로그
-            # JSON에서 읽은 데이터를 Alarm 객체로 변환
-            # 'repeat' 대신 'selected_days' 처리
-            # 저장된 리스트를 set으로 변환
-            data['selected_days'] = set(data.get('selected_days', []))
-            # 이전 버전 호환성: 'repeat' 필드가 있으면 변환 시도
-            if 'repeat' in data:
-                if data['repeat'] == 'Daily':
-                    data['selected_days'] = set(range(7))
-                elif data['repeat'] == 'Weekly':
-                    # 이전 'Weekly'는 단순화되었으므로, 특정 요일 지정 불가
-                    # 여기서는 일단 비워두거나, 기본값(e.g., 월요일) 설정 가능
-                    # data['selected_days'] = {0} # 예: 월요일로 설정
-                    pass # 또는 이전 데이터 무시
-                del data['repeat'] # 변환 후 이전 필드 제거
-                
-            # 이전 버전과의 호환성을 위해 get 사용 및 기본값 None 처리
-            alarm = Alarm(
-                id=data.get('id', ''), # 이전 버전에 id가 없을 수 있음
-                title=data.get('title', 'Untitled Alarm'),
-                time_str=data.get('time_str', '00:00'),
-                selected_days=data['selected_days'],
-                enabled=data.get('enabled', True),
-                sound_path=data.get('sound_path', None) # sound_path 로드 추가
-            )
-            logging.debug(f"  -> 변환된 Alarm 객체 [{i}]: {alarm}") # 변환된 객체 로그
-            # id가 없는 경우 새로 생성 (이전 버전 데이터 처리)
-            if not alarm.id:
-                 alarm.id = str(uuid.uuid4()) # uuid 임포트 필요 -> alarm.py에서 처리
-                 logging.warning(f"알람 데이터에 ID가 없어 새로 생성: {alarm.title} -> {alarm.id}")
-            alarms.append(alarm)
-        logging.info(f"최종 변환된 알람 개수: {len(alarms)}") # 최종 개수 로그 명확화
-        return alarms
-    except json.JSONDecodeError as e:
-        logging.error(f"알람 파일({ALARMS_FILE}) JSON 파싱 오류: {e}. 빈 목록을 반환합니다.")
-        return []
-    except (KeyError, ValueError, TypeError) as e:
-        logging.error(f"알람 데이터 처리 중 오류 ({ALARMS_FILE}): {e}. 빈 목록을 반환합니다.", exc_info=True) # 상세 오류 로깅 추가
-        return []
-    except Exception as e:
-        logging.error(f"알람 로딩 중 예기치 않은 오류 발생 ({ALARMS_FILE}): {e}. 빈 목록을 반환합니다.", exc_info=True)
+        alarms = list(_iter_json_alarms(stats))
+    except (OSError, ValueError) as e:
+        logging.error(f"알람 파일({ALARMS_FILE})을 읽을 수 없습니다: {e}. 빈 목록을 반환합니다.", exc_info=True)
+        with _storage_lock:
+            if _binary_snapshot is not None:
+                _binary_snapshot.close()
+                _binary_snapshot = None
+            if _backup_unreadable_files():
+                # 원본은 백업했으므로 이후 변경(단일 알람 저장 포함)은 전체 스냅샷으로 새로 씀
+                _saved_records, _journal_records, _snapshot_stale = {}, 0, True
+            else:
+                # 백업 없이 덮어쓰지 않음: 이후 저장은 오류 로그와 함께 거부됨
+                _saved_records, _journal_records, _snapshot_stale = None, 0, False
+                _writes_blocked = True
         return []
+    if stats['journal_applied']:
+        logging.info(f"저널 레코드 {stats['journal_applied']}개 적용.")
+    if stats['quarantined']:
+        logging.warning(f"잘못된 알람 레코드 {stats['quarantined']}개를 격리했습니다: {QUARANTINE_FILE}")
+    logging.info(f"최종 변환된 알람 개수: {len(alarms)}") # 최종 개수 로그 명확화
+    with _storage_lock:
+        _saved_records = {alarm.id: _alarm_record(alarm) for alarm in alarms}
+        if _binary_snapshot is not None:
+            _binary_snapshot.close()
+            _binary_snapshot = None
+        _journal_records = stats['journal_applied']
+        # 격리된 레코드나 잘린 저널 줄이 있으면 깨끗한 스냅샷으로 바로 다시 씀
+        # (다음 저장까지 미루면 시작할 때마다 같은 레코드가 격리 파일에 중복 기록됨)
+        _snapshot_stale = stats['quarantined'] > 0 or stats['journal_skipped'] > 0
+        if stats['schema_version'] < SCHEMA_VERSION or _snapshot_stale:
+            _persist_loaded_records(stats['schema_version'])
+        # 다시 써야 할 데이터(_snapshot_stale)는 캐시하지 않음
+        if not _snapshot_stale:
+            _write_binary_snapshot(list(_saved_records.values()), _journal_records)
+    return alarms
 
-def save_alarms(alarms: List[Alarm]):
-    """알람 목록을 파일에 저장합니다."""
+def _backup_unreadable_files() -> bool:
+    """읽을 수 없는 알람 파일과 저널을 덮어쓰기 전에 <파일>.unreadable-<시각>.bak으로 복사합니다. 성공하면 True."""
+    suffix = datetime.datetime.now().strftime(".unreadable-%Y%m%d-%H%M%S.bak")
+    try:
+        for path in (ALARMS_FILE, JOURNAL_FILE):
+            if os.path.exists(path):
+                shutil.copy2(path, path + suffix)
+                logging.warning(f"읽을 수 없는 파일을 백업했습니다: {path + suffix}")
+        return True
+    except OSError as e:
+        logging.error(f"읽을 수 없는 알람 파일 백업 실패: {e}. 원본을 보호하기 위해 알람 변경을 저장하지 않습니다.")
+        return False
+
+def _persist_loaded_records(from_version: int):
+    """불러온 레코드(_saved_records)를 현재 스키마의 깨끗한 스냅샷으로 바로 저장합니다. (_storage_lock 안에서 호출)
+
+    스키마 변환과 레코드 격리가 한 번만 일어나게 합니다. 이전 스키마 파일은 alarms.json.v<버전>.bak으로
+    남겨 둡니다. (격리된 레코드는 이미 격리 파일에 있음) 저장에 실패하면 다음 저장 때 다시 시도합니다.
+    """
+    global _journal_records, _snapshot_stale
+    try:
+        if from_version < SCHEMA_VERSION:
+            backup_path = f"{ALARMS_FILE}.v{from_version}.bak"
+            if os.path.exists(ALARMS_FILE) and not os.path.exists(backup_path):
+                shutil.copy2(ALARMS_FILE, backup_path)
+            logging.info(f"알람 파일을 스키마 버전 {SCHEMA_VERSION}(으)로 변환해 저장합니다. 원본 백업: {backup_path}")
+        _write_snapshot(_saved_records)
+        _journal_records, _snapshot_stale = 0, False # 격리된 레코드와 저널도 함께 정리됨
+    except OSError as e:
+        logging.error(f"불러온 알람 스냅샷 저장 실패: {e}")
+        _snapshot_stale = True
+
+def _load_cached_alarms() -> Optional[Sequence[Alarm]]:
+    """바이너리 캐시가 현재 JSON 파일과 일치하면 열어서 반환합니다. (Alarm은 접근할 때 생성)"""
+    global _saved_records, _journal_records, _snapshot_stale, _binary_snapshot
+    if not BINARY_SNAPSHOT_ENABLED:
+        return None
+    with _storage_lock:
+        snapshot = alarm_snapshot.open_snapshot(BINARY_SNAPSHOT_FILE, alarm_snapshot.source_key(ALARMS_FILE, JOURNAL_FILE))
+        if snapshot is None:
+            return None
+        if _binary_snapshot is not None:
+            _binary_snapshot.close()
+        _saved_records, _binary_snapshot = None, snapshot
+        _journal_records, _snapshot_stale = snapshot.journal_records, False
+    logging.info(f"바이너리 스냅샷에서 알람 {len(snapshot)}개 로드: {BINARY_SNAPSHOT_FILE}")
+    return snapshot
+
+def _write_snapshot(records: Dict[str, Dict[str, Any]]):
+    """전체 레코드를 임시 파일에 쓴 뒤 rename으로 교체하고 저널을 비웁니다. (중간에 중단되어도 이전 스냅샷 유지)"""
+    temp_path = ALARMS_FILE + ".tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        # schema_version이 alarms보다 먼저 와야 스트리밍 로더가 헤더를 읽을 수 있음 (_SCHEMA_HEADER)
+        json.dump({'schema_version': SCHEMA_VERSION, 'alarms': list(records.values())}, f, indent=4, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, ALARMS_FILE)
+    # 스냅샷 교체 후 저널을 비움. 그 사이에 중단되면 다음 로드에서 저널이 다시 적용되지만 결과는 같음
+    if os.path.exists(JOURNAL_FILE):
+        os.remove(JOURNAL_FILE)
+
+def _append_journal(entries: List[Dict[str, Any]]):
+    """변경 레코드를 한 줄씩 저널 끝에 추가합니다."""
+    data = "".join(json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + "\n" for entry in entries)
+    with open(JOURNAL_FILE, 'a', encoding='utf-8') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+def _save_json_alarms(alarms: List[Alarm]):
+    """알람 목록을 저장합니다.
+
+    마지막으로 저장된 상태와 비교해 추가/변경/삭제된 알람만 저널에 추가하므로, 알람 하나의 변경은
+    전체 알람 수와 무관한 크기의 쓰기로 끝납니다. 저널이 충분히 길어지면 전체 스냅샷으로 압축합니다.
+    """
+    global _saved_records, _journal_records, _snapshot_stale
     _ensure_dir_exists() # 저장 전에 디렉토리 확인/생성
-    logging.info(f"알람 저장 경로: {ALARMS_FILE}")
     try:
-        # Alarm 객체 리스트를 JSON 직렬화 가능한 리스트로 변환
-        alarms_data = [
-            {
-                'id': alarm.id,
-                'title': alarm.title,
-                'time_str': alarm.time_str,
-                'selected_days': list(alarm.selected_days), # set을 list로 변환
-                'enabled': alarm.enabled,
-                'sound_path': alarm.sound_path # sound_path 저장 추가
-            }
-            for alarm in alarms
-        ]
-        with open(ALARMS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(alarms_data, f, indent=4, ensure_ascii=False)
-        logging.info(f"{len(alarms)}개의 알람 저장 완료.")
+        with _storage_lock:
+            if _writes_blocked:
+                logging.error(f"알람 파일({ALARMS_FILE})을 읽지 못했고 백업도 할 수 없어 알람 목록을 저장하지 않았습니다.")
+                return
+            records = {alarm.id: _alarm_record(alarm) for alarm in alarms}
+            saved = _saved_state()
+            if saved is None or _snapshot_stale:
+                entries = None
+            else:
+                entries = [{'op': 'put', 'alarm': record} for alarm_id, record in records.items()
+                           if saved.get(alarm_id) != record]
+                entries.extend({'op': 'del', 'id': alarm_id} for alarm_id in saved if alarm_id not in records)
+                if not entries:
+                    logging.debug("저장할 알람 변경 사항이 없습니다.")
+                    return
+            # 저널이 스냅샷보다 길어지면 압축 (압축 비용은 변경 건수에 대해 분할 상환 O(1))
+            if entries is None or _journal_records + len(entries) > max(JOURNAL_COMPACT_MIN_RECORDS, len(records)):
+                _write_snapshot(records)
+                _journal_records = 0
+                _write_binary_snapshot(list(records.values()), 0)
+                logging.info(f"{len(alarms)}개의 알람 스냅샷 저장 완료: {ALARMS_FILE}")
+            else:
+                _append_journal(entries)
+                _journal_records += len(entries)
+                logging.info(f"알람 변경 {len(entries)}건 저널 기록 완료: {JOURNAL_FILE}")
+            _saved_records = records
+            _snapshot_stale = False
     except IOError as e:
         logging.error(f"알람 저장 실패: {e}")
     except Exception as e:
         logging.error(f"알람 데이터 직렬화 또는 저장 중 예외 발생: {e}", exc_info=True)
 
+def _journal_single(entry: Dict[str, Any], alarm_id: str, record: Optional[Dict[str, Any]]):
+    """알람 하나의 변경을 저널에 바로 기록합니다. (목록 전체 비교 없음)"""
+    global _journal_records, _snapshot_stale
+    _ensure_dir_exists()
+    try:
+        with _storage_lock:
+            if _writes_blocked:
+                logging.error(f"알람 파일({ALARMS_FILE})을 읽지 못했고 백업도 할 수 없어 알람 변경({alarm_id})을 저장하지 않았습니다.")
+                return
+            if _saved_state() is None:
+                logging.warning("알람 목록 로드/전체 저장 전이라 단일 알람 변경을 저널에 기록할 수 없습니다. save_alarms를 사용하세요.")
+                return
+            if _saved_records.get(alarm_id) == record and not _snapshot_stale:
+                return
+            if record is None:
+                _saved_records.pop(alarm_id, None)
+            else:
+                _saved_records[alarm_id] = record
+            # 스냅샷을 다시 써야 하는 상태(격리된 레코드, 잘린 저널)이면 저널 대신 전체 스냅샷으로 기록
+            if _snapshot_stale or _journal_records + 1 > max(JOURNAL_COMPACT_MIN_RECORDS, len(_saved_records)):
+                _write_snapshot(_saved_records)
+                _journal_records, _snapshot_stale = 0, False
+                _write_binary_snapshot(list(_saved_records.values()), 0)
+            else:
+                _append_journal([entry])
+                _journal_records += 1
+    except IOError as e:
+        logging.error(f"알람 저장 실패: {e}")
+
+def load_alarm_snapshot() -> Sequence[Alarm]:
+    """저장된 알람을 읽기 전용 시퀀스로 불러옵니다.
+
+    JSON 방식에서 바이너리 캐시가 유효하면 JSON을 파싱하지 않고 mmap된 캐시를 그대로 돌려주며,
+    Alarm 객체는 인덱스로 접근할 때 만들어집니다. 알람 일부만 필요한 경우(개수 확인, 앞부분 표시) 시작이 빠릅니다.
+    캐시 시퀀스는 다음 저장 전까지만 유효하므로, 오래 보관하거나 수정할 목록은 load_alarms를 사용하세요.
+    """
+    if STORAGE_BACKEND == STORAGE_SQLITE:
+        import sqlite_storage
+        return sqlite_storage.load_alarms()
+    cached = _load_cached_alarms()
+    if cached is not None:
+        return cached
+    return _load_json_alarms()
+
+def load_alarms() -> List[Alarm]:
+    """저장된 알람 목록을 불러옵니다. (STORAGE_BACKEND에 따라 JSON 또는 SQLite)"""
+    return list(load_alarm_snapshot())
+
+def save_alarms(alarms: List[Alarm]):
+    """알람 목록 전체를 저장합니다. 두 방식 모두 마지막 저장 상태와 비교해 바뀐 알람만 씁니다."""
+    if STORAGE_BACKEND == STORAGE_SQLITE:
+        import sqlite_storage
+        sqlite_storage.save_alarms(alarms)
+        return
+    _save_json_alarms(alarms)
+
+def save_alarm(alarm: Alarm):
+    """알람 하나를 추가/변경 저장합니다. 목록 전체를 비교하지 않으므로 알람 수와 무관하게 O(1)."""
+    if STORAGE_BACKEND == STORAGE_SQLITE:
+        import sqlite_storage
+        sqlite_storage.save_alarm(alarm)
+        return
+    record = _alarm_record(alarm)
+    _journal_single({'op': 'put', 'alarm': record}, alarm.id, record)
+
+def delete_alarm(alarm_id: str):
+    """알람 하나를 저장소에서 삭제합니다."""
+    if STORAGE_BACKEND == STORAGE_SQLITE:
+        import sqlite_storage
+        sqlite_storage.delete_alarm(alarm_id)
+        return
+    _journal_single({'op': 'del', 'id': alarm_id}, alarm_id, None)
+
 # 예제 사용
 if __name__ == "__main__":
     # 알람 목록 로드
@@ -0,0 +1,85 @@
+import os
+import sys
+import time
+import errno
+import select
+import logging
+import threading
+
+def timerfd_available() -> bool:
+    """이 환경에서 timerfd 백엔드를 쓸 수 있는지 반환합니다. (Linux, Python 3.13 이상)"""
+    return sys.platform.startswith("linux") and hasattr(os, "timerfd_create") and hasattr(os, "eventfd")
+
+class TimerfdBackend:
+    """Linux timerfd로 다음 마감 시각(CLOCK_REALTIME 절대 시각)까지 커널에서 대기하며 HeapScheduler를 구동하는 백엔드.
+
+    - 깨어나는 시점은 커널 타이머가 정하므로 별도의 주기적 깨어남이 없습니다.
+    - TFD_TIMER_CANCEL_ON_SET: 벽시계가 바뀌면(NTP, 수동 변경) 대기가 즉시 ECANCELED로 끝나고 스케줄을 다시 계산합니다.
+    - 알람 추가/변경/제거와 중지 요청은 eventfd로 대기 중인 스레드를 깨웁니다.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self._timer_fd = -1
+        self._wake_fd = -1
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._timer_fd = os.timerfd_create(time.CLOCK_REALTIME, flags=os.TFD_CLOEXEC | os.TFD_NONBLOCK)
+        self._wake_fd = os.eventfd(0, flags=os.EFD_CLOEXEC | os.EFD_NONBLOCK)
+        self._stop.clear()
+        self.engine.on_change = self._request_wake
+        self._thread = threading.Thread(target=self._run, name="AlarmScheduler-timerfd", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._request_wake()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.engine.on_change = None
+        for fd in (self._timer_fd, self._wake_fd):
+            if fd >= 0:
+                os.close(fd)
+        self._timer_fd = self._wake_fd = -1
+
+    def _request_wake(self):
+        # eventfd 카운터는 읽을 때까지 유지되므로, 대기 직전에 들어온 변경도 놓치지 않음
+        os.eventfd_write(self._wake_fd, 1)
+
+    def _arm(self):
+        deadline = self.engine.next_deadline()
+        # initial=0 이면 타이머 해제 (작업이 없으면 변경/중지 요청까지 대기)
+        initial = deadline.timestamp() if deadline is not None else 0
+        os.timerfd_settime(self._timer_fd, flags=os.TFD_TIMER_ABSTIME | os.TFD_TIMER_CANCEL_ON_SET, initial=initial)
+
+    def _run(self):
+        engine = self.engine
+        poller = select.poll()
+        poller.register(self._timer_fd, select.POLLIN)
+        poller.register(self._wake_fd, select.POLLIN)
+        logging.info("timerfd 스케줄러 스레드 시작.")
+        engine.mark_clock()
+        while not self._stop.is_set():
+            engine.check_clock_jump()
+            try:
+                engine.run_pending()
+            except Exception:
+                logging.exception("스케줄러 실행 중 오류 발생")
+            engine.mark_clock()
+            self._arm()
+            for fd, _ in poller.poll():
+                if fd == self._wake_fd:
+                    os.eventfd_read(self._wake_fd)
+                    continue
+                try:
+                    os.read(self._timer_fd, 8) # 만료 횟수 (값은 사용하지 않음)
+                except OSError as e:
+                    if e.errno == errno.ECANCELED:
+                        # 벽시계 변경: 다음 반복의 check_clock_jump에서 드리프트를 보고 스케줄을 재계산
+                        logging.info("timerfd: 시스템 시계 변경 감지.")
+                    elif e.errno != errno.EAGAIN:
+                        raise
+        logging.info("timerfd 스케줄러 스레드 종료.")
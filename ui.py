@@ -17,6 +17,7 @@ from PyQt5.QtGui import QColor, QFont, QIcon, QDesktopServices
 from PyQt5.QtMultimedia import QSoundEffect
 
 from alarm import Alarm, WEEKDAYS
+from alarm_store import AlarmStore
 
 # main.py 에서 resource_path 함수 가져오기
 # 순환 참조를 피하기 위해 함수 정의를 복사하거나 별도 모듈로 분리하는 것이 더 좋을 수 있음
@@ -393,15 +394,32 @@ class EmojiPickerDialog(QDialog):
         return self.selected_emoji
 # ------------------------
 
+class AlarmListItem(QListWidgetItem):
+    """알람 하나를 표시하는 목록 항목. 시각순으로 정렬되며 알람이 바뀌면 refresh로 그 항목만 갱신합니다."""
+
+    def __init__(self, alarm: Alarm):
+        super().__init__()
+        self.refresh(alarm)
+
+    def refresh(self, alarm: Alarm):
+        self.setData(Qt.UserRole, alarm)
+        self.setText(str(alarm))
+        # 비활성 알람은 회색, 활성 알람은 기본 색 (스타일시트 색을 따르도록 값을 지움)
+        self.setData(Qt.ForegroundRole, QColor('grey') if not alarm.enabled else None)
+
+    def __lt__(self, other):
+        # 목록 위젯의 정렬 기준: 시각, 같으면 제목
+        mine, theirs = self.data(Qt.UserRole), other.data(Qt.UserRole)
+        return (mine.minute_of_day, mine.title) < (theirs.minute_of_day, theirs.title)
+
 class AlarmApp(QWidget):
-    # 알람 목록 변경 시 메인 로직에 알리기 위한 시그널
-    alarms_updated = pyqtSignal(list)
-    alarm_deleted = pyqtSignal(str) # 삭제된 알람 ID 전달
+    # 알람 추가/변경/삭제는 AlarmStore 이벤트로 전달되므로 목록 변경 시그널은 없음
     start_on_boot_changed = pyqtSignal(bool) # 시작 프로그램 설정 변경 시그널 추가
 
-    def __init__(self, alarms: List[Alarm], tray_icon: QSystemTrayIcon, initial_start_on_boot_state: bool, parent=None):
+    def __init__(self, store: AlarmStore, tray_icon: QSystemTrayIcon, initial_start_on_boot_state: bool, parent=None):
         super().__init__(parent)
-        self.alarms = alarms
+        self.store = store
+        self._list_items: Dict[str, AlarmListItem] = {} # 알람 ID -> 목록 항목 (변경된 항목만 갱신하기 위함)
         self.current_editing_alarm_id: Optional[str] = None
         self.sound_player = QSoundEffect(self)
         self.sound_player.setLoopCount(QSoundEffect.Infinite) # 반복 재생 설정
@@ -413,6 +431,8 @@ class AlarmApp(QWidget):
 
         self.initUI()
         self.update_alarm_listwidget() # initUI 호출 후 리스트 위젯 업데이트
+        self.store.add_listener(on_added=self._on_alarm_added, on_changed=self._on_alarm_changed,
+                                on_removed=self._on_alarm_removed)
 
     def initUI(self):
         self.setWindowTitle("AlarmReminder PAAK") # 명확한 제목 설정
@@ -803,8 +823,14 @@ class AlarmApp(QWidget):
         list_title_label = QLabel("Registered Alarms")
         list_title_label.setObjectName("frameTitle")
         list_layout_wrapper.addWidget(list_title_label)
+
+        # 다음에 울릴 알람 표시 (main에서 스케줄러의 다음 실행 표를 읽어 설정)
+        self.next_alarm_label = QLabel("")
+        self.next_alarm_label.setVisible(False)
+        list_layout_wrapper.addWidget(self.next_alarm_label)
         
         self.alarm_listwidget = QListWidget()
+        self.alarm_listwidget.setSortingEnabled(True) # AlarmListItem.__lt__ 기준 (시각순), 항목이 바뀌면 자동 재정렬
         self.alarm_listwidget.currentItemChanged.connect(self.on_alarm_select)
         self.alarm_listwidget.itemDoubleClicked.connect(self.toggle_alarm_enabled)
         list_layout_wrapper.addWidget(self.alarm_listwidget)
@@ -897,20 +923,35 @@ class AlarmApp(QWidget):
         self.move(qr.topLeft()) # 계산된 왼쪽 상단 좌표로 창 이동
 
     def update_alarm_listwidget(self):
-        """리스트 위젯을 현재 알람 목록으로 업데이트합니다."""
+        """리스트 위젯을 현재 알람 목록으로 다시 만듭니다. (처음 표시할 때만 사용, 이후 변경은 알람별 이벤트로 반영)"""
         self.alarm_listwidget.clear()
-        sorted_alarms = sorted(self.alarms, key=lambda a: a.time_str)
-        logging.debug(f"Updating list widget with {len(sorted_alarms)} alarms.")
-        for alarm in sorted_alarms:
-            logging.debug(f"  - Creating item for: {alarm} (ID: {alarm.id}, Sound Path: {alarm.sound_path})") 
-            item = QListWidgetItem(str(alarm))
-            item.setData(Qt.UserRole, alarm) 
-            if not alarm.enabled:
-                item.setForeground(QColor('grey'))
+        self._list_items.clear()
+        logging.debug(f"Updating list widget with {len(self.store)} alarms.")
+        for alarm in self.store:
+            self._list_items[alarm.id] = item = AlarmListItem(alarm)
             self.alarm_listwidget.addItem(item)
         self.clear_selection()
         logging.debug("알람 리스트 위젯 업데이트 완료.")
 
+    def _on_alarm_added(self, alarm: Alarm):
+        self._list_items[alarm.id] = item = AlarmListItem(alarm)
+        self.alarm_listwidget.addItem(item)
+
+    def _on_alarm_changed(self, alarm: Alarm):
+        item = self._list_items.get(alarm.id)
+        if item is not None:
+            item.refresh(alarm) # 시각이 바뀌었으면 목록 위젯이 알아서 재정렬
+
+    def _on_alarm_removed(self, alarm: Alarm):
+        item = self._list_items.pop(alarm.id, None)
+        if item is not None:
+            self.alarm_listwidget.takeItem(self.alarm_listwidget.row(item))
+
+    def set_next_alarm_text(self, text: str):
+        """목록 위에 다음에 울릴 알람 정보를 표시합니다. 빈 문자열이면 숨깁니다."""
+        self.next_alarm_label.setText(text)
+        self.next_alarm_label.setVisible(bool(text))
+
     def clear_selection(self):
         """리스트 위젯 선택 해제 및 관련 버튼 비활성화"""
         self.alarm_listwidget.setCurrentItem(None) 
@@ -965,26 +1006,19 @@ class AlarmApp(QWidget):
         # ----------------------------------------
 
         if self.edit_mode and self.selected_alarm:
-            # 수정 모드
-            logging.info(f"알람 수정 시작: ID {self.selected_alarm.id}, 이전 값: {self.selected_alarm}")
-            self.selected_alarm.title = title
-            self.selected_alarm.time_str = time_str
-            self.selected_alarm.selected_days = selected_days
-            self.selected_alarm.sound_path = sound_path_to_save # sound_path 업데이트
-            logging.info(f"알람 수정 완료: ID {self.selected_alarm.id}, 새 값: {self.selected_alarm}")
+            # 수정 모드 (저장/스케줄/목록 항목 갱신은 store의 changed 이벤트로 처리)
+            self.store.update(self.selected_alarm.id, title=title, time_str=time_str,
+                              selected_days=selected_days, sound_path=sound_path_to_save)
         else:
             # 추가 모드
-            new_alarm = Alarm(
+            self.store.add(Alarm(
                 title=title, 
                 time_str=time_str, 
                 selected_days=selected_days,
                 sound_path=sound_path_to_save # 새 알람에 sound_path 저장
-            )
-            self.alarms.append(new_alarm)
-            logging.info(f"새 알람 추가됨: {new_alarm}")
+            ))
 
-        self.alarms_updated.emit(self.alarms) 
-        self.update_alarm_listwidget()
+        self.clear_selection()
         self.reset_form() 
         self.cancel_edit() 
 
@@ -995,9 +1029,9 @@ class AlarmApp(QWidget):
         
         logging.info(f"알람 수정 모드 진입: {self.selected_alarm}")
         self.title_edit.setText(self.selected_alarm.title)
-        hour, minute = self.selected_alarm.time_str.split(':')
-        self.hour_combo.setCurrentText(hour)
-        self.minute_combo.setCurrentText(minute)
+        hour, minute = divmod(self.selected_alarm.minute_of_day, 60)
+        self.hour_combo.setCurrentText(f"{hour:02d}")
+        self.minute_combo.setCurrentText(f"{minute:02d}")
         for i, button in enumerate(self.day_buttons):
             button.setChecked(i in self.selected_alarm.selected_days)
         
@@ -1047,12 +1081,8 @@ class AlarmApp(QWidget):
                                      QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
 
         if reply == QMessageBox.Yes:
-            logging.info(f"알람 삭제 시작: {self.selected_alarm}")
-            deleted_alarm_id = self.selected_alarm.id
-            self.alarms.remove(self.selected_alarm)
-            logging.info(f"알람 삭제 완료: ID {deleted_alarm_id}")
-            self.alarm_deleted.emit(deleted_alarm_id) # 삭제된 ID 시그널 발생
-            self.update_alarm_listwidget()
+            self.store.remove(self.selected_alarm.id) # 저장/스케줄/목록 항목 제거는 removed 이벤트로 처리
+            self.clear_selection()
             self.reset_form()
         else:
             logging.info(f"알람 삭제 취소됨: {self.selected_alarm}")
@@ -1069,18 +1099,9 @@ class AlarmApp(QWidget):
             logging.warning("토글할 알람을 찾을 수 없습니다.")
             return
 
-        target_alarm.enabled = not target_alarm.enabled
+        # 목록 항목은 changed 이벤트로 그 자리에서 갱신되므로 선택 상태가 그대로 유지됨
+        self.store.update(target_alarm.id, enabled=not target_alarm.enabled)
         logging.info(f"알람 활성화 상태 변경: {target_alarm.title} -> {'Enabled' if target_alarm.enabled else 'Disabled'}")
-        self.alarms_updated.emit(self.alarms) # 변경 사항 저장 요청
-        self.update_alarm_listwidget() # 목록 업데이트 (아이콘 및 색상 변경)
-
-        # 토글 후에도 선택 유지 (리스트 위젯에서 해당 아이템 다시 찾기)
-        for i in range(self.alarm_listwidget.count()):
-            list_item = self.alarm_listwidget.item(i)
-            if list_item.data(Qt.UserRole) == target_alarm:
-                self.alarm_listwidget.setCurrentItem(list_item) # 다시 선택
-                self.on_alarm_select(list_item, None) # 버튼 상태 업데이트
-                break
 
     def reset_form(self):
         """입력 폼을 초기 상태로 리셋합니다."""
@@ -1185,23 +1206,19 @@ class AlarmApp(QWidget):
 if __name__ == '__main__':
     app = QApplication(sys.argv)
     # 테스트용 알람 데이터
-    test_alarms = [
+    test_store = AlarmStore([
         Alarm(title="Morning Exercise", time_str="07:30", selected_days={0, 1, 2, 3, 4}), # 월~금
         Alarm(title="Weekend Jogging", time_str="09:00", selected_days={5, 6}), # 토, 일
         Alarm(title="Meeting", time_str="14:00", selected_days={2}, enabled=False) # 수요일, 비활성
-    ]
+    ])
     tray_icon = QSystemTrayIcon()
-    ex = AlarmApp(test_alarms, tray_icon, True)
+    ex = AlarmApp(test_store, tray_icon, True)
     
-    # 시그널 연결 (테스트용)
-    def handle_update(alarms_list):
-        print("--- Alarms Updated Signal Received ---")
-        # print(alarms_list)
-    def handle_delete(deleted_id):
-        print(f"--- Alarm Deleted Signal Received: {deleted_id} ---")
-        
-    ex.alarms_updated.connect(handle_update)
-    ex.alarm_deleted.connect(handle_delete)
+    # 이벤트 연결 (테스트용)
+    test_store.add_listener(
+        on_added=lambda alarm: print(f"--- Alarm Added: {alarm} ---"),
+        on_changed=lambda alarm: print(f"--- Alarm Changed: {alarm} ---"),
+        on_removed=lambda alarm: print(f"--- Alarm Removed: {alarm.id} ---"))
     
     ex.show()
     sys.exit(app.exec_()) 
\ No newline at end of file